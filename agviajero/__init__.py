@@ -0,0 +1,27 @@
+'''
+Motor compartido del algoritmo genético para el problema del agente viajero, usado por los
+scripts AGE.py y AGM.py. Optimización corre el algoritmo completo; también se puede usar
+desde la línea de comandos con python -m agviajero. Importar el paquete no carga matplotlib:
+sólo se importa al graficar. Si numba está instalado, los núcleos del ciclo generacional se
+compilan (ver nucleos; AGVIAJERO_BACKEND=numpy lo evita).
+'''
+from .nucleos import BACKEND
+from .evaluacion import MatrizDistancias, LongitudesPoblación, EvaluarPoblación
+from .operadores import OperadorMutación, OperadorElitismo
+from .poblacion import Población
+from .seleccion import SelecciónTorneo, SelecciónRuleta
+from .cruce import CruceOX, CrucePMX, CruceERX, OperadorCruce
+from .inicializacion import InicializarPoblación, InicializarPoblaciónModificada
+from .vecinos import RejillaCiudades, KVecinosCercanos
+from .busquedalocal import BúsquedaLocal, OperadorBúsquedaLocal, DosOpt, OrOpt
+from .islas import OptimizaciónIslas, MigraciónAnillo
+from .graficas import GraficarRuta, GraficadorAsíncrono, GraficarLongitudes
+from .telemetria import Telemetría, LeerTelemetría
+from .lectura import LeerArchivo, LeerCoordenadas
+from .convergencia import ControlConvergencia
+from .perfilado import Perfilador
+from .puntocontrol import GuardarPuntoControl, CargarPuntoControl
+from .motor import Optimización
+from .resultados import Resultado, LeerResultado, ListarResultados, LeerRuta, GuardarResultado
+from .lotes import ResolverLote, ListarInstancias
+from .descomposicion import OptimizaciónDescompuesta, Particionar
@@ -0,0 +1,98 @@
+'''
+Línea de comandos del algoritmo genético.
+Uso: python -m agviajero --cities CoordenadasCiudades.txt --pop 40 --init greedy
+'''
+import argparse
+from .convergencia import ControlConvergencia
+from .descomposicion import OptimizaciónDescompuesta
+from .lotes import ResolverLote, TablaResumen
+from .motor import Optimización
+from .perfilado import Perfilador
+
+INICIALIZACIONES = {'random':'aleatoria', 'greedy':'vecino'}
+CRUCES = {'none':None, 'ox':'ox', 'pmx':'pmx', 'erx':'erx'}
+SELECCIONES = {'tournament':'torneo', 'roulette':'ruleta'}
+BÚSQUEDAS = {'none':'ninguna', 'best':'mejor', 'all':'todos'}
+DESCOMPOSICIONES = {'kmeans':'kmedias', 'grid':'rejilla'}
+ESTANCAMIENTO = {'stop':'detener', 'restart':'reiniciar', 'boost':'mutación'}
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog='python -m agviajero',
+                                     description='Algoritmo genético para el problema del agente viajero.')
+    parser.add_argument('--cities',default='CoordenadasCiudades.txt',help='archivo de coordenadas (.txt, .csv o .tsp)')
+    parser.add_argument('--pop',type=int,default=20,help='cromosomas por población')
+    parser.add_argument('--generations',type=int,default=10000,help='cantidad de generaciones')
+    parser.add_argument('--init',choices=sorted(INICIALIZACIONES),default='random',
+                        help='random: permutaciones aleatorias (AGE); greedy: ciudad más cercana (AGM)')
+    parser.add_argument('--seed',type=int,default=23432,help='semilla del generador')
+    parser.add_argument('--workers',type=int,default=1,help='islas en paralelo, una por proceso')
+    parser.add_argument('--migration',type=int,default=100,help='generaciones entre migraciones de islas')
+    parser.add_argument('--local-search',choices=sorted(BÚSQUEDAS),default='none',
+                        help='cromosomas que se mejoran con 2-opt y Or-opt: ninguno, el mejor o todos')
+    parser.add_argument('--crossover',choices=sorted(CRUCES),default='none',
+                        help='cruce de orden (ox), parcialmente mapeado (pmx) o de aristas (erx)')
+    parser.add_argument('--selection',choices=sorted(SELECCIONES),default='tournament',
+                        help='selección de padres para el cruce')
+    parser.add_argument('--patience',type=int,default=None,help='generaciones sin mejora para considerar estancamiento')
+    parser.add_argument('--min-improvement',type=float,default=0.0,help='mejora relativa mínima que reinicia la paciencia')
+    parser.add_argument('--time-limit',type=float,default=None,help='segundos máximos de optimización')
+    parser.add_argument('--target',type=float,default=None,help='se detiene al llegar a esta longitud')
+    parser.add_argument('--on-stagnation',choices=sorted(ESTANCAMIENTO),default='stop',
+                        help='stop: termina; restart: recrea la población; boost: aumenta la mutación')
+    parser.add_argument('--checkpoint',default=None,help='archivo .npz donde se guarda periódicamente el estado')
+    parser.add_argument('--checkpoint-every',type=int,default=500,help='generaciones entre puntos de control')
+    parser.add_argument('--resume',action='store_true',help='continúa desde --checkpoint si el archivo existe')
+    parser.add_argument('--batch',default=None,help='carpeta o manifiesto de instancias a resolver en lote')
+    parser.add_argument('--jobs',type=int,default=None,
+                        help='procesos en paralelo: instancias con --batch o grupos con --decompose (por defecto, uno por núcleo)')
+    parser.add_argument('--output',default='Lotes',help='carpeta de resultados del lote')
+    parser.add_argument('--decompose',choices=sorted(DESCOMPOSICIONES),default=None,
+                        help='divide las ciudades en grupos espaciales, resuelve cada uno y une las rutas')
+    parser.add_argument('--cluster-size',type=int,default=1000,help='ciudades por grupo con --decompose')
+    parser.add_argument('--profile',action='store_true',help='mide el tiempo de cada etapa e imprime un resumen')
+    parser.add_argument('--trace',default=None,help='json con la línea de tiempo de las etapas (formato de Chrome)')
+    parser.add_argument('--no-plots',action='store_true',help='no crea gráficas')
+    parser.add_argument('--name',default=None,help='prefijo de la carpeta de resultados (por defecto AGE, AGM o AGD)')
+    opciones = parser.parse_args(argumentos)
+    if opciones.resume and opciones.checkpoint is None:
+        parser.error('--resume necesita --checkpoint')
+    if opciones.workers>1 and opciones.checkpoint is not None:
+        parser.error('--checkpoint no se puede usar con --workers mayor que 1')
+    if opciones.batch is not None and opciones.checkpoint is not None:
+        parser.error('--checkpoint no se puede usar con --batch')
+    if opciones.decompose is not None and (opciones.batch is not None or opciones.checkpoint is not None):
+        parser.error('--decompose no se puede usar con --batch ni con --checkpoint')
+    nombre = opciones.name or ('AGM' if opciones.init=='greedy' else 'AGE')
+    control = ControlConvergencia(opciones.patience, opciones.min_improvement, opciones.time_limit, opciones.target,
+                                  ESTANCAMIENTO[opciones.on_stagnation])
+    parámetros = dict(tamañoPoblación=opciones.pop, nGeneraciones=opciones.generations,
+                      inicialización=INICIALIZACIONES[opciones.init], semilla=opciones.seed, nIslas=opciones.workers,
+                      generacionesMigración=opciones.migration, búsquedaLocal=BÚSQUEDAS[opciones.local_search],
+                      cruce=CRUCES[opciones.crossover], selección=SELECCIONES[opciones.selection],
+                      control=control, graficar=not opciones.no_plots, nombre=nombre)
+    if opciones.batch is not None: #cada instancia en su carpeta dentro de --output
+        resumen = ResolverLote(opciones.batch, opciones.output, opciones.jobs, **parámetros)
+        print(TablaResumen(resumen))
+        return resumen
+    if opciones.decompose is not None: #los grupos se resuelven en paralelo, uno por proceso
+        porGrupo = {clave:valor for clave, valor in parámetros.items()
+                    if clave not in ('semilla','nIslas','generacionesMigración','graficar','nombre')}
+        resultado = OptimizaciónDescompuesta(opciones.cities, opciones.cluster_size, DESCOMPOSICIONES[opciones.decompose],
+                                             opciones.seed, opciones.jobs, nombre=opciones.name or 'AGD', **porGrupo)
+        print('Longitud mínima: '+str(resultado.longitud))
+        if resultado.carpeta is not None:
+            print('Resultados en: '+resultado.carpeta)
+        return resultado
+    perfilador = Perfilador(opciones.profile or opciones.trace is not None, opciones.trace)
+    resultado = Optimización(opciones.cities, puntoControl=opciones.checkpoint,
+                             generacionesPuntoControl=opciones.checkpoint_every, reanudar=opciones.resume,
+                             perfilador=perfilador, **parámetros)
+    print('Longitud mínima: '+str(resultado.longitud)+' en '+str(len(resultado.historial))+' generaciones')
+    if resultado.carpeta is not None:
+        print('Resultados en: '+resultado.carpeta)
+    if perfilador.activo:
+        print(perfilador.Resumen())
+    return resultado
+
+if __name__ == '__main__':
+    main()
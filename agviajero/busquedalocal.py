@@ -0,0 +1,232 @@
+import math
+from collections import deque
+import numpy as np
+
+EPSILON = 1e-10 #mejoras menores se consideran error de redondeo
+
+class _Ruta:
+    '''
+    Ruta cerrada guardada como lista de ciudades más la posición de cada ciudad, para
+    consultar sucesor y predecesor en tiempo constante. Las distancias se calculan a partir
+    de las coordenadas, así que no hace falta la matriz de distancias.
+    '''
+    def __init__(self,cromosoma,ciudadesXY):
+        XY = np.asarray(ciudadesXY,dtype=np.float64)
+        self.X = XY[:,0].tolist()
+        self.Y = XY[:,1].tolist()
+        self.Reconstruir([int(c) for c in cromosoma])
+
+    def Reconstruir(self,ciudades):
+        self.ciudades = ciudades
+        self.n = len(ciudades)
+        self.posición = [0]*len(self.X)
+        for i, ciudad in enumerate(ciudades):
+            self.posición[ciudad] = i
+
+    def D(self,a,b):
+        return math.hypot(self.X[a]-self.X[b],self.Y[a]-self.Y[b])
+
+    def Vecina(self,ciudad,dirección):
+        '''
+        Sucesor (dirección 1) o predecesor (dirección -1) de la ciudad en la ruta.
+        '''
+        return self.ciudades[(self.posición[ciudad]+dirección)%self.n]
+
+    def Invertir(self,i,j):
+        '''
+        Invierte el tramo de posiciones i..j (inclusive, de forma cíclica). Si el tramo es más
+        de la mitad de la ruta se invierte el complemento, que da la misma ruta recorrida en
+        sentido contrario.
+        '''
+        n = self.n
+        largo = (j-i)%n+1
+        if 2*largo>n:
+            i, j, largo = (j+1)%n, (i-1)%n, n-largo
+        ciudades = self.ciudades
+        posición = self.posición
+        for t in range(largo//2):
+            p, q = (i+t)%n, (j-t)%n
+            ciudades[p], ciudades[q] = ciudades[q], ciudades[p]
+            posición[ciudades[p]] = p
+            posición[ciudades[q]] = q
+
+    def Reconectar(self,a,b,c,d):
+        '''
+        Movimiento 2-opt entre las aristas (a,b) y (c,d) de un recorrido a b ... c d: queda
+        a c ... b d. Funciona en cualquiera de los dos sentidos en que esté guardada la ruta.
+        '''
+        if self.Vecina(a,1)==b:
+            self.Invertir(self.posición[b],self.posición[c])
+        else: #guardada como d c ... b a
+            self.Invertir(self.posición[c],self.posición[b])
+
+def DosOpt(ruta,vecinos,activas):
+    '''
+    Aplica movimientos 2-opt mientras mejoren la ruta. Para cada ciudad a sólo se prueban
+    como nuevo extremo las ciudades c de su lista de vecinos más cercanos que estén más cerca
+    de a que su vecina actual en la ruta; las ciudades que no logran mejora quedan fuera de
+    la cola (bits "no mirar") hasta que un movimiento toque alguna de sus aristas.
+    Entradas:
+    ruta: _Ruta: ruta a mejorar; se modifica en el lugar
+    vecinos: list: vecinos[a] es la lista de ciudades cercanas a a, de la más cercana a la más lejana
+    activas: iterable: ciudades por revisar al comenzar
+    Salidas:
+    mejora: float: reducción total de la longitud
+    tocadas: set: ciudades cuyas aristas cambiaron
+    '''
+    cola = deque(activas)
+    enCola = set(cola)
+    tocadas = set()
+    mejora = 0
+    while cola:
+        a = cola.popleft()
+        enCola.discard(a)
+        for dirección in (1,-1): #arista hacia el sucesor y hacia el predecesor
+            b = ruta.Vecina(a,dirección)
+            dab = ruta.D(a,b)
+            movimiento = None
+            for c in vecinos[a]:
+                dac = ruta.D(a,c)
+                if dac>=dab: #vecinos ordenados: ninguno más lejano puede mejorar
+                    break
+                e = ruta.Vecina(c,dirección)
+                if c==b or e==a:
+                    continue
+                ganancia = dab+ruta.D(c,e)-dac-ruta.D(b,e)
+                if ganancia>EPSILON:
+                    movimiento = (c,e,ganancia)
+                    break
+            if movimiento is not None:
+                c, e, ganancia = movimiento
+                i, j = ruta.posición[a], ruta.posición[c]
+                if dirección==1: #a b ... c e -> a c ... b e
+                    ruta.Invertir(i+1,j)
+                else: #e c ... b a -> e b ... c a
+                    ruta.Invertir(j,i-1)
+                mejora += ganancia
+                for ciudad in (a,b,c,e):
+                    tocadas.add(ciudad)
+                    if ciudad not in enCola:
+                        cola.append(ciudad)
+                        enCola.add(ciudad)
+                break
+    return mejora, tocadas
+
+def OrOpt(ruta,vecinos,activas,largoMáximo=3):
+    '''
+    Aplica movimientos Or-opt mientras mejoren la ruta: un tramo de 1 a largoMáximo ciudades
+    se saca de su lugar y se inserta, en cualquier sentido, junto a una ciudad de la lista de
+    vecinos de alguno de sus extremos. Usa la misma cola de ciudades activas que DosOpt.
+    Entradas:
+    ruta: _Ruta: ruta a mejorar; se modifica en el lugar
+    vecinos: list: vecinos[a] es la lista de ciudades cercanas a a, de la más cercana a la más lejana
+    activas: iterable: ciudades por revisar al comenzar
+    largoMáximo: int: largo máximo del tramo que se mueve
+    Salidas:
+    mejora: float: reducción total de la longitud
+    tocadas: set: ciudades cuyas aristas cambiaron
+    '''
+    cola = deque(activas)
+    enCola = set(cola)
+    tocadas = set()
+    mejora = 0
+    while cola:
+        s1 = cola.popleft()
+        enCola.discard(s1)
+        movimiento = None
+        for largo in range(1,min(largoMáximo,ruta.n-3)+1):
+            i = ruta.posición[s1]
+            tramo = [ruta.ciudades[(i+t)%ruta.n] for t in range(largo)]
+            se = tramo[-1]
+            p, nx = ruta.Vecina(s1,-1), ruta.Vecina(se,1)
+            ganancia = ruta.D(p,s1)+ruta.D(se,nx)-ruta.D(p,nx) #lo que se ahorra al sacar el tramo
+            if ganancia<=EPSILON:
+                continue
+            for extremo, otro in ((s1,se),(se,s1)):
+                for c in vecinos[extremo]:
+                    dc = ruta.D(c,extremo)
+                    if dc>=ganancia:
+                        break
+                    if c in tramo:
+                        continue
+                    for cn in (ruta.Vecina(c,1),ruta.Vecina(c,-1)):
+                        if cn in tramo:
+                            continue
+                        neto = ganancia-(dc+ruta.D(otro,cn)-ruta.D(c,cn))
+                        if neto>EPSILON:
+                            movimiento = (tramo,extremo,c,cn,neto)
+                            break
+                    if movimiento is not None:
+                        break
+                if movimiento is not None:
+                    break
+            if movimiento is not None:
+                break
+        if movimiento is None:
+            continue
+        tramo, extremo, c, cn, neto = movimiento
+        s1, se = tramo[0], tramo[-1]
+        p, nx = ruta.Vecina(s1,-1), ruta.Vecina(se,1)
+        if ruta.Vecina(c,1)!=cn: #se nombran para que el recorrido sea p s1 ... se nx ... c cn
+            c, cn = cn, c
+            extremo = s1 if extremo==se else se
+        ruta.Reconectar(p,s1,c,cn) #p c ... nx se ... s1 cn
+        ruta.Reconectar(p,c,nx,se) #p nx ... c se ... s1 cn
+        if extremo==s1: #el tramo se da vuelta para que s1 quede junto a c
+            ruta.Reconectar(c,se,s1,cn)
+        mejora += neto
+        for ciudad in tramo+[p,nx,c,cn]:
+            tocadas.add(ciudad)
+            if ciudad not in enCola:
+                cola.append(ciudad)
+                enCola.add(ciudad)
+    return mejora, tocadas
+
+def BúsquedaLocal(cromosoma,ciudadesXY,vecinos,orOpt=True,activas=None):
+    '''
+    Mejora una ruta alternando 2-opt y Or-opt hasta que ninguno encuentre mejora. Después de
+    la primera pasada sólo se revisan las ciudades cuyas aristas cambiaron.
+    Entradas:
+    cromosoma: 1xn matrix: ruta a mejorar
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    vecinos: nxk numpy array o list: listas de vecinos cercanos (ver KVecinosCercanos)
+    orOpt: bool: si también se aplica Or-opt
+    activas: iterable o None: ciudades a revisar al comenzar; por defecto todas
+    Salidas:
+    cromosomaMejorado: 1xn numpy array: ruta mejorada, del mismo tipo que el cromosoma
+    mejora: float: reducción total de la longitud
+    '''
+    ruta = _Ruta(cromosoma,ciudadesXY)
+    if isinstance(vecinos,np.ndarray):
+        vecinos = vecinos.tolist()
+    activas = list(ruta.ciudades if activas is None else activas)
+    mejoraTotal = 0
+    primera = True
+    while activas: #cada operador deja la ruta en un óptimo local propio
+        mejora, tocadas = DosOpt(ruta,vecinos,activas)
+        mejoraTotal += mejora
+        if not orOpt:
+            break
+        mejora, tocadas = OrOpt(ruta,vecinos,activas if primera else tocadas)
+        mejoraTotal += mejora
+        activas = list(tocadas) #2-opt sólo vuelve a mirar lo que cambió Or-opt
+        primera = False
+    return np.asarray(ruta.ciudades,dtype=np.asarray(cromosoma).dtype), mejoraTotal
+
+def OperadorBúsquedaLocal(población,filas,ciudadesXY,vecinos,orOpt=True):
+    '''
+    Operador memético: aplica BúsquedaLocal a los cromosomas indicados de la población y
+    reemplaza cada uno por su versión mejorada.
+    Entradas:
+    población: Población: población a modificar en el lugar
+    filas: iterable: índices de los cromosomas a mejorar (por ejemplo sólo el mejor)
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    vecinos: nxk numpy array o list: listas de vecinos cercanos (ver KVecinosCercanos)
+    orOpt: bool: si también se aplica Or-opt
+    '''
+    if isinstance(vecinos,np.ndarray):
+        vecinos = vecinos.tolist()
+    for i in filas:
+        cromosomaMejorado, mejora = BúsquedaLocal(población.cromosomas[i],ciudadesXY,vecinos,orOpt)
+        if mejora>0:
+            población.Reemplazar(i,cromosomaMejorado)
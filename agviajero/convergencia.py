@@ -0,0 +1,103 @@
+import time
+
+class ControlConvergencia:
+    '''
+    Decide en cada generación si la optimización sigue, se detiene o está estancada, según
+    estos criterios (los que sean None no se usan):
+    - paciencia: generaciones seguidas sin una mejora de al menos mejoraRelativa
+    - tiempoMáximo: segundos desde la primera generación revisada
+    - longitudObjetivo: longitud que se considera suficiente
+    Ante el estancamiento la acción puede ser 'detener', 'reiniciar' (el motor vuelve a crear
+    todos los cromosomas menos el mejor) o 'mutación' (se duplica la cantidad de intercambios
+    por cromosoma y generación, hasta máximoIntercambios, y vuelve a 1 con la siguiente mejora).
+    '''
+    ACCIONES = ('detener','reiniciar','mutación')
+
+    def __init__(self,paciencia=None,mejoraRelativa=0.0,tiempoMáximo=None,longitudObjetivo=None,
+                 acción='detener',máximoIntercambios=16):
+        '''
+        Entradas:
+        paciencia: int o None: generaciones sin mejora antes de considerar estancada la búsqueda
+        mejoraRelativa: float: fracción de la mejor longitud que debe bajar para contar como mejora
+        tiempoMáximo: float o None: segundos de cómputo permitidos
+        longitudObjetivo: float o None: se detiene al llegar a esta longitud
+        acción: str: 'detener', 'reiniciar' o 'mutación'
+        máximoIntercambios: int: tope de intercambios por cromosoma con la acción 'mutación'
+        '''
+        if acción not in self.ACCIONES:
+            raise ValueError('acción debe ser detener, reiniciar o mutación: '+str(acción))
+        self.paciencia = paciencia
+        self.mejoraRelativa = mejoraRelativa
+        self.tiempoMáximo = tiempoMáximo
+        self.longitudObjetivo = longitudObjetivo
+        self.acción = acción
+        self.máximoIntercambios = máximoIntercambios
+        self.Reiniciar()
+
+    def Reiniciar(self):
+        '''
+        Olvida el estado de una corrida anterior (reloj, mejor longitud, estancamientos), para
+        usar el mismo control en varias corridas.
+        '''
+        self.inicio = None
+        self.mejor = float('inf')
+        self.últimaMejora = 0
+        self.intercambios = 1
+        self.estancamientos = 0
+
+    def Configuración(self):
+        '''
+        Salidas:
+        configuración: dict: parámetros con los que se creó el control
+        '''
+        return {'paciencia':self.paciencia, 'mejoraRelativa':self.mejoraRelativa, 'tiempoMáximo':self.tiempoMáximo,
+                'longitudObjetivo':self.longitudObjetivo, 'acción':self.acción,
+                'máximoIntercambios':self.máximoIntercambios}
+
+    def Estado(self):
+        '''
+        Salidas:
+        datos: dict: estado interno, para un punto de control (el tiempo como segundos transcurridos)
+        '''
+        transcurrido = 0.0 if self.inicio is None else time.monotonic()-self.inicio
+        return {'transcurrido':transcurrido, 'mejor':self.mejor, 'últimaMejora':self.últimaMejora,
+                'intercambios':self.intercambios, 'estancamientos':self.estancamientos}
+
+    def Restaurar(self,datos):
+        '''
+        Vuelve al estado retornado por Estado; el tiempo ya usado se descuenta de tiempoMáximo.
+        '''
+        self.inicio = time.monotonic()-datos['transcurrido']
+        self.mejor = datos['mejor']
+        self.últimaMejora = datos['últimaMejora']
+        self.intercambios = datos['intercambios']
+        self.estancamientos = datos['estancamientos']
+
+    def Revisar(self,generación,mejorLongitud):
+        '''
+        Entradas:
+        generación: int: generación actual
+        mejorLongitud: float: longitud del mejor cromosoma en esta generación
+        Salidas:
+        estado: str: 'continuar', 'detener' o 'estancado' (cuando la acción no es detener)
+        '''
+        if self.inicio is None:
+            self.inicio = time.monotonic()
+        if self.longitudObjetivo is not None and mejorLongitud<=self.longitudObjetivo:
+            return 'detener'
+        if self.tiempoMáximo is not None and time.monotonic()-self.inicio>=self.tiempoMáximo:
+            return 'detener'
+        if mejorLongitud<self.mejor*(1-self.mejoraRelativa):
+            self.mejor = mejorLongitud
+            self.últimaMejora = generación
+            self.intercambios = 1
+            return 'continuar'
+        if self.paciencia is not None and generación-self.últimaMejora>=self.paciencia:
+            if self.acción=='detener':
+                return 'detener'
+            self.estancamientos += 1
+            self.últimaMejora = generación #se da otro plazo antes del siguiente estancamiento
+            if self.acción=='mutación':
+                self.intercambios = min(2*self.intercambios,self.máximoIntercambios)
+            return 'estancado'
+        return 'continuar'
@@ -0,0 +1,134 @@
+import numpy as np
+from . import nucleos
+from .seleccion import SELECCIONES
+
+def PuntosCorte(nHijos, nGenes, rng):
+    '''
+    Sortea un segmento [inicio,fin) no vacío por hijo.
+    Entradas:
+    nHijos: int: cantidad de hijos
+    nGenes: int: cantidad de genes de cada cromosoma
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    inicio, fin: 1xnHijos numpy array: límites de cada segmento
+    enSegmento: nHijosxnGenes numpy array: True en las posiciones dentro del segmento
+    '''
+    puntos = rng.integers(0,nGenes,(nHijos,2))
+    inicio = puntos.min(1)
+    fin = puntos.max(1)+1
+    posiciones = np.arange(nGenes)
+    enSegmento = (posiciones>=inicio[:,None])&(posiciones<fin[:,None])
+    return inicio, fin, enSegmento
+
+def CruceOX(padres1, padres2, rng):
+    '''
+    Cruce de orden (OX): cada hijo copia un segmento del primer padre y completa las demás
+    posiciones, empezando después del segmento, con las ciudades que faltan en el orden en que
+    aparecen en el segundo padre. Todos los hijos se construyen a la vez con máscaras que tienen
+    la misma cantidad de elementos por fila.
+    Entradas:
+    padres1, padres2: kxn numpy array: padres de cada hijo, uno por fila
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    hijos: kxn numpy array: un hijo por par de padres
+    '''
+    k, n = padres1.shape
+    F = np.arange(k)[:,None]
+    inicio, fin, enSegmento = PuntosCorte(k,n,rng)
+    hijos = np.where(enSegmento,padres1,0).astype(padres1.dtype)
+    copiadas = np.zeros((k,n),dtype=bool) #ciudades que ya están en el hijo
+    copiadas[F,padres1] = enSegmento
+    orden = (fin[:,None]+np.arange(n))%n #posiciones desde el final del segmento, dando la vuelta
+    segundoRotado = padres2[F,orden]
+    faltan = ~copiadas[F,segundoRotado]
+    libres = ~enSegmento[F,orden]
+    filas = np.broadcast_to(F,(k,n))
+    hijos[filas[libres],orden[libres]] = segundoRotado[faltan] #ambas máscaras recorren las filas en orden
+    return hijos
+
+def CrucePMX(padres1, padres2, rng):
+    '''
+    Cruce parcialmente mapeado (PMX): cada hijo copia un segmento del primer padre y el resto
+    del segundo; si una ciudad del segundo padre ya está en el segmento se reemplaza siguiendo
+    la correspondencia entre ambos padres dentro del segmento. La correspondencia se sigue para
+    todos los hijos a la vez, como mucho tantas veces como el largo del segmento.
+    Entradas:
+    padres1, padres2: kxn numpy array: padres de cada hijo, uno por fila
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    hijos: kxn numpy array: un hijo por par de padres
+    '''
+    k, n = padres1.shape
+    F = np.arange(k)[:,None]
+    inicio, fin, enSegmento = PuntosCorte(k,n,rng)
+    posiciónEnPadre1 = np.empty((k,n),dtype=np.intp)
+    posiciónEnPadre1[F,padres1] = np.arange(n)
+    hijos = np.where(enSegmento,padres1,padres2).astype(padres1.dtype)
+    fuera = ~enSegmento
+    while True:
+        posición = posiciónEnPadre1[F,hijos]
+        repetidas = fuera&enSegmento[F,posición]
+        if not repetidas.any():
+            return hijos
+        hijos[repetidas] = padres2[F,posición][repetidas]
+
+def TablaAristas(padre1, padre2):
+    '''
+    Vecinos de cada ciudad en alguno de los dos padres, sin repetir.
+    Entradas:
+    padre1, padre2: 1xn numpy array: padres
+    Salidas:
+    tabla: nx4 numpy array: vecinos de cada ciudad; -1 en los lugares repetidos
+    '''
+    n = len(padre1)
+    tabla = np.empty((n,4),dtype=np.intp)
+    for columna, padre in enumerate((padre1,padre2)):
+        tabla[padre,2*columna] = np.roll(padre,1)
+        tabla[padre,2*columna+1] = np.roll(padre,-1)
+    for columna in range(1,4):
+        for previa in range(columna):
+            tabla[tabla[:,columna]==tabla[:,previa],columna] = -1
+    return tabla
+
+def CruceERX(padres1, padres2, rng):
+    '''
+    Cruce por recombinación de aristas (ERX): cada hijo empieza en la primera ciudad del primer
+    padre y sigue por la ciudad vecina (en alguno de los padres) que tenga menos vecinos sin
+    visitar; si no queda ninguna se salta a una ciudad sin visitar al azar. Las tablas de aristas
+    son vectorizadas; el recorrido es secuencial y se hace en nucleos.RecorridoAristas, compilado
+    con numba si está instalado.
+    Entradas:
+    padres1, padres2: kxn numpy array: padres de cada hijo, uno por fila
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    hijos: kxn numpy array: un hijo por par de padres
+    '''
+    k, n = padres1.shape
+    tablas = np.empty((k,n,4),dtype=np.intp)
+    azar = np.empty((k,n),dtype=np.intp) #orden de los saltos cuando no quedan vecinos
+    for i in range(k):
+        tablas[i] = TablaAristas(padres1[i],padres2[i])
+        azar[i] = rng.permutation(n)
+    hijos = np.empty_like(padres1)
+    nucleos.RecorridoAristas(tablas,np.ascontiguousarray(padres1[:,0],dtype=np.intp),azar,hijos)
+    return hijos
+
+CRUCES = {'ox':CruceOX, 'pmx':CrucePMX, 'erx':CruceERX}
+
+def OperadorCruce(población, excluir, rng, cruce='ox', selección='torneo'):
+    '''
+    Reemplaza todos los cromosomas menos el indicado (el mejor) por hijos de padres escogidos
+    de la población actual, y calcula sus longitudes.
+    Entradas:
+    población: Población: población a modificar en el lugar
+    excluir: int: índice del cromosoma que se conserva
+    rng: numpy Generator: generador de números aleatorios
+    cruce: str: 'ox', 'pmx' o 'erx'
+    selección: str: 'torneo' o 'ruleta'
+    '''
+    filas = np.arange(len(población))
+    filas = filas[filas!=excluir]
+    padres = SELECCIONES[selección](población.puntuaciones,2*len(filas),rng)
+    C = población.cromosomas
+    hijos = CRUCES[cruce](C[padres[0::2]],C[padres[1::2]],rng)
+    población.ReemplazarFilas(filas,hijos)
@@ -0,0 +1,189 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .busquedalocal import BúsquedaLocal
+from .lectura import LeerArchivo
+from .motor import Optimización
+from .resultados import Resultado, IdentificadorCorrida, CarpetaCorrida, GuardarResultado
+from .telemetria import COLUMNAS
+from .vecinos import KVecinosCercanos
+
+MÉTODOS = ('kmedias','rejilla')
+
+def LongitudRuta(ruta, ciudadesXY):
+    '''
+    Longitud de una ruta cerrada calculada con las coordenadas, sin matriz de distancias.
+    Entradas:
+    ruta: 1xn numpy array: orden de las ciudades
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    Salidas:
+    longitud: float: longitud de la ruta
+    '''
+    XY = np.asarray(ciudadesXY,dtype=np.float64)[ruta]
+    return float(np.hypot(*(XY-np.roll(XY,-1,axis=0)).T).sum())
+
+def MásCercanos(XY, centros, bloque=8192):
+    '''
+    Índice del centro más cercano a cada punto, por bloques para no formar la matriz completa.
+    '''
+    etiquetas = np.empty(len(XY),dtype=np.intp)
+    for inicio in range(0,len(XY),bloque):
+        parte = XY[inicio:inicio+bloque]
+        distancias = (parte[:,None,0]-centros[None,:,0])**2+(parte[:,None,1]-centros[None,:,1])**2
+        etiquetas[inicio:inicio+bloque] = np.argmin(distancias,axis=1)
+    return etiquetas
+
+def Particionar(ciudadesXY, tamañoGrupo, método='kmedias', rng=None, iteraciones=20):
+    '''
+    Reparte las ciudades en grupos espaciales de alrededor de tamañoGrupo ciudades.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    tamañoGrupo: int: cantidad deseada de ciudades por grupo
+    método: str: 'kmedias' (Lloyd, partiendo de ciudades al azar) o 'rejilla' (celdas cuadradas)
+    rng: numpy Generator: generador para los centros iniciales de kmedias
+    iteraciones: int: iteraciones máximas de kmedias
+    Salidas:
+    etiquetas: 1xn numpy array: grupo de cada ciudad, numerados desde 0 sin grupos vacíos
+    centros: gx2 numpy array: centroide de cada grupo
+    '''
+    if método not in MÉTODOS:
+        raise ValueError('método debe ser kmedias o rejilla: '+str(método))
+    XY = np.asarray(ciudadesXY,dtype=np.float64)
+    nGrupos = max(1,math.ceil(len(XY)/tamañoGrupo))
+    if método=='rejilla':
+        mínimo = XY.min(0)
+        lado = max(float((XY.max(0)-mínimo).max()),1e-12)
+        nCeldas = max(1,math.ceil(math.sqrt(nGrupos)))
+        celdas = np.minimum(((XY-mínimo)/(lado/nCeldas)).astype(np.int64),nCeldas-1)
+        etiquetas = celdas[:,0]*nCeldas+celdas[:,1]
+    else:
+        rng = rng if rng is not None else np.random.default_rng()
+        centros = XY[rng.choice(len(XY),nGrupos,replace=False)]
+        etiquetas = MásCercanos(XY,centros)
+        for iteración in range(iteraciones):
+            cantidad = np.bincount(etiquetas,minlength=nGrupos)
+            vacíos = cantidad==0
+            centros = np.stack([np.bincount(etiquetas,XY[:,0],nGrupos),np.bincount(etiquetas,XY[:,1],nGrupos)],axis=1)
+            centros[~vacíos] /= cantidad[~vacíos,None]
+            centros[vacíos] = XY[rng.choice(len(XY),int(vacíos.sum()),replace=False)] #se vuelven a sembrar
+            nuevas = MásCercanos(XY,centros)
+            if np.array_equal(nuevas,etiquetas):
+                break
+            etiquetas = nuevas
+    usados, etiquetas = np.unique(etiquetas,return_inverse=True)
+    cantidad = np.bincount(etiquetas)
+    centros = np.stack([np.bincount(etiquetas,XY[:,0]),np.bincount(etiquetas,XY[:,1])],axis=1)/cantidad[:,None]
+    return etiquetas, centros
+
+def _ResolverGrupo(ciudadesXY, semilla, parámetros):
+    '''
+    Resuelve un grupo con el motor del AG, dentro de un proceso trabajador.
+    Entradas:
+    ciudadesXY: mx2 numpy array: coordenadas de las ciudades del grupo
+    semilla: int: semilla del grupo
+    parámetros: dict: argumentos de Optimización
+    Salidas:
+    ruta: 1xm numpy array: orden de las ciudades, con índices locales del grupo
+    '''
+    if len(ciudadesXY)<4: #con 3 ciudades o menos cualquier orden es el mismo ciclo
+        return np.arange(len(ciudadesXY))
+    return Optimización(ciudadesXY,semilla=semilla,graficar=False,guardar=False,**parámetros).ruta
+
+def OrdenarGrupos(centros, semilla):
+    '''
+    Orden en que se recorren los grupos: una ruta corta sobre los centroides, construida con la
+    ciudad más cercana y mejorada con 2-opt y Or-opt.
+    '''
+    if len(centros)<4:
+        return np.arange(len(centros))
+    orden = Optimización(centros,tamañoPoblación=10,nGeneraciones=200,inicialización='vecino',semilla=semilla,
+                         graficar=False,guardar=False).ruta
+    return BúsquedaLocal(orden,centros,KVecinosCercanos(centros,10))[0]
+
+def Coser(rutas, orden, centros, ciudadesXY):
+    '''
+    Une las rutas cerradas de los grupos en una sola ruta. Cada grupo se entra por su ciudad más
+    cercana a la salida del grupo anterior, se recorre completo y se sale por la vecina de la
+    entrada (en uno u otro sentido) más cercana al siguiente grupo.
+    Entradas:
+    rutas: list: ruta de cada grupo, con índices globales
+    orden: 1xg numpy array: orden de los grupos
+    centros: gx2 numpy array: centroide de cada grupo
+    ciudadesXY: nx2 numpy array: coordenadas de todas las ciudades
+    Salidas:
+    ruta: 1xn numpy array: ruta completa
+    uniones: list: pares (salida, entrada) de ciudades unidas entre grupos consecutivos
+    '''
+    XY = np.asarray(ciudadesXY,dtype=np.float64)
+    tramos = []
+    uniones = []
+    salida = None
+    for posición, grupo in enumerate(orden):
+        ruta = np.asarray(rutas[grupo])
+        if salida is None:
+            entrada = 0
+        else:
+            entrada = int(np.argmin(np.hypot(*(XY[ruta]-XY[salida]).T)))
+            uniones.append((salida,int(ruta[entrada])))
+        directo = np.roll(ruta,-entrada) #termina en la predecesora de la entrada
+        inverso = np.append(directo[:1],directo[:0:-1]) #termina en la sucesora
+        destino = centros[orden[posición+1]] if posición+1<len(orden) else XY[tramos[0][0] if tramos else directo[0]]
+        tramo = min((directo,inverso),key=lambda t: math.hypot(*(XY[t[-1]]-destino)))
+        tramos.append(tramo)
+        salida = int(tramo[-1])
+    if len(orden)>1:
+        uniones.append((salida,int(tramos[0][0])))
+    return np.concatenate(tramos), uniones
+
+def OptimizaciónDescompuesta(ciudades='CoordenadasCiudades.txt', tamañoGrupo=1000, método='kmedias', semilla=23432,
+                              nProcesos=None, guardar=True, nombre='AGD', directorio=None, **parámetros):
+    '''
+    Divide y vencerás para instancias muy grandes, donde la matriz de distancias completa no
+    cabe en memoria: las ciudades se reparten en grupos espaciales, cada grupo se resuelve con
+    Optimización en paralelo, las rutas se unen siguiendo una ruta sobre los centroides y
+    finalmente se aplica 2-opt y Or-opt a las ciudades cercanas a las fronteras entre grupos.
+    Fuera de los grupos las distancias siempre se calculan a partir de las coordenadas.
+    Entradas:
+    ciudades: str o nx2 numpy array: archivo de coordenadas (ver LeerArchivo) o las coordenadas
+    tamañoGrupo: int: ciudades por grupo (cada grupo usa una matriz de tamañoGrupo^2)
+    método: str: 'kmedias' o 'rejilla'
+    semilla: int: semilla principal; cada grupo recibe una derivada de ella
+    nProcesos: int o None: grupos resueltos a la vez; por defecto uno por núcleo
+    guardar: bool: si se guarda la ruta en la carpeta '<nombre>-<identificador>' (ver resultados)
+    nombre: str: prefijo de la carpeta de la corrida
+    directorio: str o None: carpeta donde se crea la de la corrida; None es la actual
+    parámetros: argumentos de Optimización para cada grupo (tamañoPoblación, nGeneraciones,
+    inicialización, búsquedaLocal, cruce, selección, control)
+    Salidas:
+    resultado: Resultado: ruta completa, su longitud y la carpeta de la corrida; el historial
+    queda vacío porque cada grupo tiene el suyo
+    '''
+    ubicaciónCiudades = LeerArchivo(ciudades) if isinstance(ciudades,str) else np.asarray(ciudades,dtype=np.float64)
+    ubicaciónCiudades = np.asarray(ubicaciónCiudades,dtype=np.float64)
+    semillas = np.random.SeedSequence(semilla).generate_state(2)
+    etiquetas, centros = Particionar(ubicaciónCiudades,tamañoGrupo,método,np.random.default_rng(semillas[0]))
+    miembros = np.split(np.argsort(etiquetas,kind='stable'),np.cumsum(np.bincount(etiquetas))[:-1])
+    semillasGrupos = [int(s) for s in np.random.SeedSequence(int(semillas[1])).generate_state(len(miembros))]
+    nProcesos = max(1,min(nProcesos or os.cpu_count() or 1,len(miembros)))
+    with ProcessPoolExecutor(nProcesos) as ejecutor:
+        tareas = [ejecutor.submit(_ResolverGrupo,ubicaciónCiudades[grupo],semillaGrupo,parámetros)
+                  for grupo, semillaGrupo in zip(miembros,semillasGrupos)]
+        rutas = [grupo[tarea.result()] for grupo, tarea in zip(miembros,tareas)] #índices locales a globales
+    orden = OrdenarGrupos(centros,semilla)
+    ruta, uniones = Coser(rutas,orden,centros,ubicaciónCiudades)
+    # frontera: ciudades con algún vecino cercano en otro grupo, más las que se unieron
+    vecinos = KVecinosCercanos(ubicaciónCiudades,10)
+    frontera = np.flatnonzero((etiquetas[vecinos]!=etiquetas[:,None]).any(axis=1))
+    activas = np.union1d(frontera,np.array(uniones,dtype=np.intp).ravel()).tolist()
+    ruta, mejora = BúsquedaLocal(ruta,ubicaciónCiudades,vecinos,activas=activas)
+    longitud = LongitudRuta(ruta,ubicaciónCiudades)
+    carpeta = None
+    if guardar:
+        configuración = {'tamañoGrupo':tamañoGrupo, 'método':método,
+                         'parámetros':{clave:(valor.Configuración() if clave=='control' and valor is not None else valor)
+                                       for clave, valor in parámetros.items()}}
+        carpeta = CarpetaCorrida(nombre,IdentificadorCorrida(configuración,ubicaciónCiudades,semilla),directorio)
+        GuardarResultado(carpeta,ruta,longitud,{'nombre':nombre, 'semilla':semilla, 'configuración':configuración,
+            'instancia':ciudades if isinstance(ciudades,str) else None, 'grupos':len(miembros), 'mejoraFronteras':mejora})
+    return Resultado(ruta,longitud,np.empty((0,len(COLUMNAS))),carpeta)
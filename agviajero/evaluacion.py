@@ -0,0 +1,38 @@
+import numpy as np
+from . import nucleos
+
+def MatrizDistancias(ciudadesXY):
+    '''
+    Calcula una sola vez la distancia euclidiana entre cada par de ciudades.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    Salidas:
+    distancias: nxn numpy array: distancias[a,b] es la distancia entre las ciudades a y b
+    '''
+    X, Y = np.asarray(ciudadesXY, dtype=np.float64).T
+    return np.hypot(X[:,None]-X[None,:], Y[:,None]-Y[None,:])
+
+def LongitudesPoblación(población,distancias):
+    '''
+    Calcula la longitud del recorrido cerrado de todos los cromosomas a la vez, tomando de la
+    matriz de distancias cada arista (gen, gen siguiente) y sumándolas por fila en orden (ver
+    nucleos).
+    Entradas:
+    población: nxm matrix: matriz que contiene los cromosomas
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    Salidas:
+    longitudes: 1xn numpy array: longitud de la ruta de cada cromosoma
+    '''
+    return nucleos.Longitudes(np.ascontiguousarray(población),distancias)
+
+def EvaluarPoblación(población,distancias):
+    '''
+    Calcula el valor de evaluación de cada uno de los cromosomas en la población. La evaluación
+    es el inverso de la distancia total recorrida por la secuencia del cromosoma.
+    Entradas:
+    población: nxm matrix: matriz que contiene los cromosomas
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    Salidas:
+    puntuaciones: 1xn numpy array: lista de puntuaciones de cada cromosoma
+    '''
+    return 1/LongitudesPoblación(población,distancias)
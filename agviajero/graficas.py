@@ -0,0 +1,117 @@
+import queue
+import multiprocessing
+import numpy as np
+
+def GraficarRuta(cromosoma,ciudadesXY,generación,subdirectorio):
+    '''
+    Crea una gráfica con matplotlib de la trayectoria seguida por la secuencia de un cromosoma.
+    La ruta cerrada se dibuja como una sola polilínea sobre los vértices del recorrido.
+    Entradas:
+    cromosoma: 1xn matrix: cromosoma a graficar
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    generación: int: ciclo principal de la simulación
+    subdirectorio: str: nombre de la carpeta donde se guardará la gráfica
+    Salidas:
+    Esta función no retorna ningún valor, pero crea un archivo png en el directorio indicado.
+    '''
+    import matplotlib.pyplot as plt #sólo se importa cuando de verdad se grafica
+    X, Y = np.asarray(ciudadesXY,dtype=np.float64).T
+    secuencia = np.append(cromosoma,cromosoma[0])
+    plt.plot(X[secuencia],Y[secuencia],'b')
+    plt.plot(X,Y,'r*')
+    plt.plot(X[cromosoma[0]],Y[cromosoma[0]],'g*',label='inicio')
+    plt.plot(X[cromosoma[-1]],Y[cromosoma[-1]],'y*',label='fin')
+    plt.title('Mejor ruta en gen: '+str(generación))
+    endPath = subdirectorio+'/'+'Ruta en gen '+str(generación)+'.png'
+    plt.savefig(endPath)
+    plt.close('all')
+    return
+
+def _TrabajadorGráficas(cola,ciudadesXY,subdirectorio):
+    '''
+    Ciclo del proceso de gráficas: toma rutas de la cola y las grafica hasta recibir None.
+    '''
+    import matplotlib
+    matplotlib.use('Agg') #el proceso no tiene ventanas
+    while True:
+        tarea = cola.get()
+        if tarea is None:
+            break
+        cromosoma, generación = tarea
+        GraficarRuta(cromosoma,ciudadesXY,generación,subdirectorio)
+
+class GraficadorAsíncrono:
+    '''
+    Grafica rutas en un proceso aparte para que el ciclo de optimización nunca espere a
+    matplotlib. Las rutas se envían por una cola acotada; si la cola está llena la ruta no
+    se encola sino que reemplaza a la pendiente, de modo que las mejoras intermedias que
+    llegan más rápido de lo que se pueden graficar se combinan en la más reciente.
+    Uso:
+    with GraficadorAsíncrono(ciudadesXY,subfolder) as graficador:
+        graficador.Enviar(cromosoma,generación)
+    '''
+    def __init__(self,ciudadesXY,subdirectorio,capacidad=2):
+        '''
+        Entradas:
+        ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+        subdirectorio: str: nombre de la carpeta donde se guardarán las gráficas
+        capacidad: int: cantidad máxima de rutas esperando en la cola
+        '''
+        self.cola = multiprocessing.Queue(capacidad)
+        self.pendiente = None
+        self.descartadas = 0
+        self.proceso = multiprocessing.Process(target=_TrabajadorGráficas,
+                                               args=(self.cola,np.asarray(ciudadesXY),subdirectorio),daemon=True)
+        self.proceso.start()
+
+    def Enviar(self,cromosoma,generación):
+        '''
+        Encola una ruta para graficar sin bloquear.
+        Entradas:
+        cromosoma: 1xn matrix: cromosoma a graficar; se copia, así que puede seguir mutando
+        generación: int: generación en la que se encontró la ruta
+        '''
+        tarea = (np.array(cromosoma), generación)
+        try:
+            self.cola.put_nowait(tarea)
+            self.pendiente = None
+        except queue.Full: #la cola está llena: la ruta reemplaza a la pendiente
+            if self.pendiente is not None:
+                self.descartadas += 1
+            self.pendiente = tarea
+
+    def Cerrar(self):
+        '''
+        Envía la ruta pendiente, si la hay, y espera a que el proceso termine de graficar.
+        '''
+        if self.pendiente is not None:
+            self.cola.put(self.pendiente)
+            self.pendiente = None
+        self.cola.put(None)
+        self.proceso.join()
+        self.cola.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*excepción):
+        self.Cerrar()
+
+def GraficarLongitudes(historial,nombreArchivo):
+    '''
+    Grafica la longitud más corta y la longitud promedio en cada generación.
+    Entradas:
+    historial: gx5 numpy array: filas de Telemetría (generación, mejor, promedio, peor, diversidad)
+    nombreArchivo: str: nombre del archivo png
+    Salidas:
+    Esta función no retorna ningún valor, pero crea un archivo png con el nombre indicado.
+    '''
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(7, 7))
+    ax.plot(historial[:,0], historial[:,1], 'b',label = 'Longitud más corta')
+    ax.plot(historial[:,0], historial[:,2], 'r',label = 'Longitud promedio')
+    ax.set_title('Longitud vs generación')
+    ax.legend()
+    fig.savefig(nombreArchivo)
+    plt.close('all')
+    return
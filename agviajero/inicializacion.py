@@ -0,0 +1,54 @@
+import numpy as np
+from .poblacion import Población
+from .vecinos import RejillaCiudades
+
+def InicializarPoblación(tamañoPoblación, nGenes, rng):
+    '''
+    Crea una matriz de tamaño tamañoPoblaciónxnGenes que contiene los cromosomas iniciales.
+    Cada cromosoma es una permutación aleatoria de las ciudades; todas las filas se barajan a
+    la vez, en tiempo lineal, sin generar genes repetidos que haya que descartar.
+    Entradas:
+    tamañoPoblación: int: cantidad de cromosomas deseados
+    nGenes: int: cantidad de genes que debe tener cada cromosoma
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    población: nxm numpy array: matriz con todos los cromosomas
+    '''
+    tipo = np.int16 if nGenes<=np.iinfo(np.int16).max+1 else np.int32
+    ordenada = np.tile(np.arange(nGenes,dtype=tipo),(tamañoPoblación,1))
+    return rng.permuted(ordenada,axis=1,out=ordenada)
+
+def InicializarPoblaciónModificada(tamañoPoblación, nGenes, XYCiudades, distancias, rng):
+    '''
+    Crea una matriz de tamaño tamañoPoblaciónxnGenes que contiene los cromosomas iniciales.
+    Cada gen inicial se escoge aleatoriamente, pero cada gen siguiente es el de la ciudad más
+    cercana a la ciudad previa, buscada en una RejillaCiudades. Se conserva el mejor cromosoma
+    y los demás se mutan de 3 a 10 veces cada uno.
+    Entradas:
+    tamañoPoblación: int: cantidad de cromosomas deseados
+    nGenes: int: cantidad de genes que debe tener cada cromosoma
+    XYciudades: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    población: Población: población con todos los cromosomas y sus longitudes
+    '''
+    tipo = np.int16 if nGenes<=np.iinfo(np.int16).max+1 else np.int32
+    cromosomas = np.empty((tamañoPoblación,nGenes),dtype=tipo)
+    rejilla = RejillaCiudades(XYCiudades)
+    for i in range(tamañoPoblación): #cada ciclo es un nuevo cromosoma
+        if i>0:
+            rejilla.Reiniciar()
+        nodoActual = int(rng.integers(0,nGenes))
+        for x in range(nGenes): #nuevo gen en el cromosoma
+            cromosomas[i,x] = nodoActual
+            rejilla.Visitar(nodoActual)
+            nodoActual = rejilla.MásCercanoNoVisitado(nodoActual)
+    población = Población(cromosomas,distancias)
+    icromosomaMax = población.Mejor() #se selecciona el que no va a cambiar
+    for icromosoma in range(tamañoPoblación):
+        if icromosoma != icromosomaMax:
+            mutaciones = rng.integers(3,11)
+            for mutacion in range(mutaciones):
+                población.Mutar(icromosoma,rng)
+    return población
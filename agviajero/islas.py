@@ -0,0 +1,206 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .busquedalocal import OperadorBúsquedaLocal
+from .cruce import OperadorCruce
+from .evaluacion import MatrizDistancias
+from .inicializacion import InicializarPoblación, InicializarPoblaciónModificada
+from .poblacion import Población
+from .telemetria import Telemetría
+from .vecinos import KVecinosCercanos
+
+_compartido = {} #arreglos compartidos del proceso trabajador
+
+def _Compartir(arreglo):
+    '''
+    Copia un arreglo a un bloque de memoria compartida.
+    Entradas:
+    arreglo: numpy array: arreglo a compartir
+    Salidas:
+    bloque: SharedMemory: bloque creado; quien lo crea debe cerrarlo y liberarlo
+    descripción: tuple: (nombre, forma, tipo) para abrirlo desde otro proceso
+    '''
+    bloque = shared_memory.SharedMemory(create=True,size=max(arreglo.nbytes,1))
+    copia = np.ndarray(arreglo.shape,dtype=arreglo.dtype,buffer=bloque.buf)
+    copia[...] = arreglo
+    return bloque, (bloque.name, arreglo.shape, arreglo.dtype.str)
+
+def _IniciarTrabajador(descripciones):
+    '''
+    Inicializador de cada proceso: abre los bloques compartidos una sola vez, para no enviar
+    las coordenadas ni la matriz de distancias con cada tarea.
+    Entradas:
+    descripciones: dict: nombre del arreglo -> (nombre, forma, tipo) del bloque compartido
+    '''
+    for clave, (nombre, forma, tipo) in descripciones.items():
+        bloque = shared_memory.SharedMemory(name=nombre)
+        _compartido[clave] = np.ndarray(forma,dtype=tipo,buffer=bloque.buf)
+        _compartido['bloque '+clave] = bloque #se conserva la referencia mientras viva el proceso
+
+def _EvolucionarIsla(cromosomas, rng, tamañoPoblación, inicialización, generaciónInicial, nGeneraciones, muestreoDiversidad,
+                     cruce=None, selección='torneo', búsquedaLocal='ninguna', generacionesBúsquedaLocal=50,
+                     detenerEn=None):
+    '''
+    Evoluciona una isla durante nGeneraciones con búsqueda local, elitismo, cruce opcional y
+    mutación, igual que el ciclo principal de los scripts. Se ejecuta dentro de un proceso trabajador.
+    Entradas:
+    cromosomas: mxn numpy array o None: población de la isla; si es None se inicializa
+    rng: numpy Generator: generador propio de la isla
+    tamañoPoblación: int: cantidad de cromosomas de la isla
+    inicialización: str: 'aleatoria' o 'vecino' (ciudad más cercana)
+    generaciónInicial: int: número de la primera generación de esta época
+    nGeneraciones: int: generaciones a simular antes de la siguiente migración
+    muestreoDiversidad: int: generaciones entre cálculos de la diversidad
+    cruce: str o None: 'ox', 'pmx' o 'erx'
+    selección: str: 'torneo' o 'ruleta'
+    búsquedaLocal: str: 'ninguna', 'mejor' o 'todos': cromosomas que se mejoran con 2-opt y Or-opt
+    generacionesBúsquedaLocal: int: generaciones entre búsquedas locales
+    detenerEn: int o None: generación en que se detuvo la corrida; se simula sólo hasta su paso
+    memético, así que la población queda igual que cuando se registró esa generación
+    Salidas:
+    cromosomas: mxn numpy array: población final de la isla
+    longitudes: 1xm numpy array: longitud de cada cromosoma
+    rng: numpy Generator: generador con su estado actualizado
+    historial: nGeneracionesx5 numpy array: filas de Telemetría de la época
+    '''
+    distancias = _compartido['distancias']
+    nGenes = len(distancias)
+    if cromosomas is not None:
+        población = Población(cromosomas,distancias)
+    elif inicialización=='vecino':
+        población = InicializarPoblaciónModificada(tamañoPoblación,nGenes,_compartido['ciudades'],distancias,rng)
+    else:
+        población = Población(InicializarPoblación(tamañoPoblación,nGenes,rng),distancias)
+    telemetría = Telemetría(cadaN=max(nGeneraciones,1),muestreoDiversidad=muestreoDiversidad)
+    for generación in range(generaciónInicial,generaciónInicial+nGeneraciones):
+        if búsquedaLocal!='ninguna' and generación%generacionesBúsquedaLocal==0: #paso memético
+            filas = [población.Mejor()] if búsquedaLocal=='mejor' else range(tamañoPoblación)
+            OperadorBúsquedaLocal(población,filas,_compartido['ciudades'],_compartido['vecinos'])
+        if generación==detenerEn:
+            break
+        icromosomaMax = población.Mejor()
+        telemetría.Registrar(generación,población.longitudes,población.cromosomas,icromosomaMax)
+        if cruce is not None:
+            OperadorCruce(población,icromosomaMax,rng,cruce,selección)
+        población.MutarLote(icromosomaMax,rng)
+    return población.cromosomas, población.longitudes, rng, telemetría.Historial()
+
+def MigraciónAnillo(poblaciones, longitudes, nMigrantes):
+    '''
+    Copia los nMigrantes mejores cromosomas de cada isla sobre los peores de la isla siguiente
+    en el anillo. Todas las islas envían a partir de su estado previo a la migración.
+    Entradas:
+    poblaciones: list: matriz de cromosomas de cada isla; se modifican en el lugar
+    longitudes: list: longitudes de cada isla; se modifican en el lugar
+    nMigrantes: int: cantidad de cromosomas que migran desde cada isla
+    '''
+    nIslas = len(poblaciones)
+    migrantes = []
+    for isla in range(nIslas): #primero se eligen todos, para no reenviar recién llegados
+        mejores = np.argsort(longitudes[isla],kind='stable')[:nMigrantes]
+        migrantes.append((poblaciones[isla][mejores].copy(), longitudes[isla][mejores].copy()))
+    for isla in range(nIslas):
+        destino = (isla+1)%nIslas
+        peores = np.argsort(longitudes[destino],kind='stable')[::-1][:nMigrantes]
+        poblaciones[destino][peores] = migrantes[isla][0]
+        longitudes[destino][peores] = migrantes[isla][1]
+
+def OptimizaciónIslas(ubicaciónCiudades, nIslas, tamañoPoblación, nGeneraciones, inicialización='aleatoria',
+                      generacionesMigración=100, nMigrantes=1, semilla=23432, nProcesos=None, distancias=None,
+                      telemetría=None, control=None, cruce=None, selección='torneo', búsquedaLocal='ninguna',
+                      generacionesBúsquedaLocal=50, vecinos=None):
+    '''
+    Modelo de islas: nIslas poblaciones independientes evolucionan en paralelo, una por núcleo,
+    y cada generacionesMigración generaciones sus mejores cromosomas migran a la isla siguiente
+    en un anillo. Cada isla tiene su propio generador, derivado de la semilla principal, por lo
+    que el resultado es reproducible sin importar cuántos procesos se usen. Las coordenadas y
+    la matriz de distancias se comparten con los procesos mediante memoria compartida.
+    Entradas:
+    ubicaciónCiudades: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    nIslas: int: cantidad de poblaciones
+    tamañoPoblación: int: cantidad de cromosomas de cada isla
+    nGeneraciones: int: cantidad total de generaciones
+    inicialización: str: 'aleatoria' o 'vecino' (ciudad más cercana)
+    generacionesMigración: int: generaciones entre migraciones
+    nMigrantes: int: cromosomas que envía cada isla en cada migración
+    semilla: int: semilla principal
+    nProcesos: int: procesos a usar; por defecto uno por isla, sin pasar de los núcleos disponibles
+    distancias: nxn numpy array: matriz de distancias, si ya fue calculada
+    telemetría: Telemetría: donde se registra en cada generación la mejor y la peor longitud
+    entre islas y el promedio de las islas; si es None se crea una en memoria
+    control: ControlConvergencia o None: se revisa con la mejor longitud de cada generación al
+    terminar cada época; sólo se usa para detener antes (el estancamiento se ignora). Si se
+    detiene, la época se repite desde su inicio hasta la generación en que se detuvo, así que
+    la ruta retornada es la mejor de esa generación
+    cruce: str o None: 'ox', 'pmx' o 'erx'; None deja sólo elitismo y mutación
+    selección: str: 'torneo' o 'ruleta': cómo se escogen los padres del cruce
+    búsquedaLocal: str: 'ninguna', 'mejor' o 'todos': cromosomas de cada isla que se mejoran con
+    2-opt y Or-opt
+    generacionesBúsquedaLocal: int: generaciones entre búsquedas locales
+    vecinos: nxk numpy array o None: listas de vecinos cercanos de la búsqueda local, si ya
+    fueron calculadas (ver KVecinosCercanos)
+    Salidas:
+    mejorCromosoma: 1xn numpy array: mejor ruta encontrada entre todas las islas
+    telemetría: Telemetría: historial de la corrida
+    '''
+    ciudades = np.asarray(ubicaciónCiudades,dtype=np.float64)
+    if distancias is None:
+        distancias = MatrizDistancias(ciudades)
+    if nProcesos is None:
+        nProcesos = min(nIslas,os.cpu_count() or 1)
+    compartidos = [('ciudades',ciudades),('distancias',distancias)]
+    if búsquedaLocal!='ninguna':
+        if vecinos is None:
+            vecinos = KVecinosCercanos(ciudades,10)
+        compartidos.append(('vecinos',vecinos))
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(semilla).spawn(nIslas)]
+    poblaciones = [None]*nIslas
+    longitudes = [None]*nIslas
+    if telemetría is None:
+        telemetría = Telemetría()
+    bloques = []
+    try:
+        descripciones = {}
+        for clave, arreglo in compartidos:
+            bloque, descripciones[clave] = _Compartir(np.ascontiguousarray(arreglo))
+            bloques.append(bloque)
+        with ProcessPoolExecutor(nProcesos,initializer=_IniciarTrabajador,initargs=(descripciones,)) as ejecutor:
+            generación = 0
+            while generación<nGeneraciones: #cada ciclo es una época entre migraciones
+                época = min(generacionesMigración,nGeneraciones-generación)
+                tareas = [ejecutor.submit(_EvolucionarIsla,poblaciones[isla],rngs[isla],tamañoPoblación,inicialización,
+                                          generación,época,telemetría.muestreoDiversidad,cruce,selección,
+                                          búsquedaLocal,generacionesBúsquedaLocal)
+                          for isla in range(nIslas)]
+                previas = (list(poblaciones),list(rngs)) #estado al comenzar la época
+                historiales = []
+                for isla, tarea in enumerate(tareas):
+                    poblaciones[isla], longitudes[isla], rngs[isla], historial = tarea.result()
+                    historiales.append(historial)
+                historiales = np.stack(historiales)
+                detener = False
+                for fila in range(época): #se combinan las islas generación por generación
+                    telemetría.Agregar(generación+fila, historiales[:,fila,1].min(), historiales[:,fila,2].mean(),
+                                       historiales[:,fila,3].max(), historiales[:,fila,4].mean())
+                    if control is not None and control.Revisar(generación+fila,historiales[:,fila,1].min())=='detener':
+                        detener = True
+                        break
+                if detener: #cada isla tiene su generador, así que la época se repite igual hasta fila
+                    tareas = [ejecutor.submit(_EvolucionarIsla,previas[0][isla],previas[1][isla],tamañoPoblación,
+                                              inicialización,generación,fila+1,telemetría.muestreoDiversidad,cruce,
+                                              selección,búsquedaLocal,generacionesBúsquedaLocal,generación+fila)
+                              for isla in range(nIslas)]
+                    for isla, tarea in enumerate(tareas):
+                        poblaciones[isla], longitudes[isla], rngs[isla], historial = tarea.result()
+                    break
+                generación += época
+                if nIslas>1 and generación<nGeneraciones:
+                    MigraciónAnillo(poblaciones,longitudes,nMigrantes)
+    finally:
+        for bloque in bloques:
+            bloque.close()
+            bloque.unlink()
+    islaMejor = int(np.argmin([np.min(l) for l in longitudes]))
+    mejorCromosoma = poblaciones[islaMejor][int(np.argmin(longitudes[islaMejor]))]
+    return mejorCromosoma, telemetría
@@ -0,0 +1,116 @@
+import hashlib
+import glob
+import os
+import numpy as np
+
+CARPETA_CACHE = '.ciudades_cache'
+
+def LeerArchivo(nombreArchivo,usarCache=True):
+    '''
+    Obtiene las coordenadas de las ciudades a partir de un archivo y las retorna como una
+    matriz de n filas [x,y]. El formato se deduce de la extensión: .tsp (TSPLIB), .csv
+    (dos columnas x,y con encabezado opcional) o, para cualquier otra, la matriz entre
+    corchetes de CoordenadasCiudades.txt. El resultado se guarda en un .npy dentro de
+    CARPETA_CACHE, junto al archivo, y las siguientes lecturas lo cargan mapeado en memoria
+    mientras el archivo no cambie.
+    Entradas:
+    nombreArchivo: str: nombre del archivo que se va a leer
+    usarCache: bool: si es False siempre se vuelve a leer el texto
+    Salidas:
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    '''
+    if not usarCache:
+        return LeerCoordenadas(nombreArchivo)
+    archivoCache = ArchivoCache(nombreArchivo)
+    if os.path.exists(archivoCache):
+        return np.load(archivoCache,mmap_mode='r')
+    ciudadesXY = LeerCoordenadas(nombreArchivo)
+    try:
+        GuardarCache(ciudadesXY,nombreArchivo,archivoCache)
+    except OSError: #sin permisos de escritura la caché simplemente no se usa
+        pass
+    return ciudadesXY
+
+def LeerCoordenadas(nombreArchivo):
+    '''
+    Lee y convierte el texto del archivo, sin usar la caché.
+    Entradas:
+    nombreArchivo: str: nombre del archivo que se va a leer
+    Salidas:
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    '''
+    extensión = os.path.splitext(nombreArchivo)[1].lower()
+    if extensión=='.tsp':
+        return LeerTSPLIB(nombreArchivo)
+    if extensión=='.csv':
+        return LeerCSV(nombreArchivo)
+    return LeerCorchetes(nombreArchivo)
+
+def LeerCorchetes(nombreArchivo):
+    '''
+    Lee una matriz escrita como [[x1, y1],\\n[x2, y2], ...]. Se quitan los corchetes y todos
+    los números se convierten de una sola vez.
+    '''
+    with open(nombreArchivo,'rt') as archivo:
+        texto = archivo.read().translate({ord('['):' ', ord(']'):' '})
+    números = np.fromstring(texto,sep=',')
+    if len(números)%2:
+        raise ValueError(nombreArchivo+': la cantidad de coordenadas no es par')
+    return números.reshape(-1,2)
+
+def LeerCSV(nombreArchivo):
+    '''
+    Lee un csv cuyas dos primeras columnas son x,y. Si la primera línea no es numérica se
+    toma como encabezado.
+    '''
+    with open(nombreArchivo,'rt') as archivo:
+        primera = archivo.readline()
+    try:
+        [float(valor) for valor in primera.split(',')[:2]]
+        encabezado = 0
+    except ValueError:
+        encabezado = 1
+    return np.loadtxt(nombreArchivo,delimiter=',',skiprows=encabezado,usecols=(0,1),ndmin=2)
+
+def LeerTSPLIB(nombreArchivo):
+    '''
+    Lee la sección NODE_COORD_SECTION de un archivo TSPLIB (líneas "índice x y").
+    '''
+    with open(nombreArchivo,'rt') as archivo:
+        líneas = archivo.read().splitlines()
+    inicio = None
+    for i, línea in enumerate(líneas):
+        if línea.strip().upper().startswith('NODE_COORD_SECTION'):
+            inicio = i+1
+            break
+    if inicio is None:
+        raise ValueError(nombreArchivo+': no tiene NODE_COORD_SECTION')
+    fin = inicio
+    while fin<len(líneas) and líneas[fin].strip() and líneas[fin].strip().upper()!='EOF' \
+            and líneas[fin].split()[0][0].isdigit():
+        fin += 1
+    return np.loadtxt(líneas[inicio:fin],usecols=(1,2),ndmin=2)
+
+def ArchivoCache(nombreArchivo):
+    '''
+    Nombre del .npy de caché; incluye un hash de la ruta, el tamaño y la fecha de
+    modificación del archivo, así que cualquier cambio produce otro nombre.
+    '''
+    ruta = os.path.abspath(nombreArchivo)
+    estado = os.stat(ruta)
+    clave = hashlib.blake2b((ruta+'|'+str(estado.st_size)+'|'+str(estado.st_mtime_ns)).encode(),digest_size=8).hexdigest()
+    carpeta, nombre = os.path.split(ruta)
+    return os.path.join(carpeta,CARPETA_CACHE,nombre+'.'+clave+'.npy')
+
+def GuardarCache(ciudadesXY,nombreArchivo,archivoCache):
+    '''
+    Escribe la caché de forma atómica y borra las de versiones anteriores del mismo archivo.
+    '''
+    carpeta = os.path.dirname(archivoCache)
+    os.makedirs(carpeta,exist_ok=True)
+    for anterior in glob.glob(os.path.join(carpeta,glob.escape(os.path.basename(nombreArchivo))+'.*.npy')):
+        os.remove(anterior)
+    temporal = archivoCache+'.'+str(os.getpid())+'.tmp'
+    with open(temporal,'wb') as archivo:
+        np.save(archivo,np.ascontiguousarray(ciudadesXY,dtype=np.float64))
+    os.replace(temporal,archivoCache)
@@ -0,0 +1,133 @@
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .motor import Optimización
+
+EXTENSIONES = ('.txt','.csv','.tsp')
+COLUMNAS_RESUMEN = ('instancia','ciudades','longitud','generaciones','segundos','carpeta','error')
+
+def ListarInstancias(entrada):
+    '''
+    Obtiene los archivos de coordenadas de un lote.
+    Entradas:
+    entrada: str: carpeta (se toman sus archivos .txt, .csv y .tsp en orden alfabético) o
+    manifiesto de texto con un archivo por línea, relativo al manifiesto; las líneas vacías y
+    las que empiezan con # se ignoran
+    Salidas:
+    instancias: list: rutas de los archivos de coordenadas
+    '''
+    if os.path.isdir(entrada):
+        return [os.path.join(entrada,archivo) for archivo in sorted(os.listdir(entrada))
+                if os.path.splitext(archivo)[1].lower() in EXTENSIONES]
+    base = os.path.dirname(entrada)
+    with open(entrada,'rt') as manifiesto:
+        líneas = [línea.strip() for línea in manifiesto]
+    return [os.path.join(base,línea) for línea in líneas if línea and not línea.startswith('#')]
+
+def CarpetasSalida(instancias, salida):
+    '''
+    Una carpeta por instancia dentro de salida, con el nombre del archivo sin extensión; si dos
+    instancias se llaman igual la segunda recibe ' (1)', etc.
+    '''
+    carpetas = []
+    usadas = set()
+    for instancia in instancias:
+        nombre = os.path.splitext(os.path.basename(instancia))[0]
+        carpeta, intento = nombre, 1
+        while carpeta in usadas:
+            carpeta = nombre+' ('+str(intento)+')'
+            intento += 1
+        usadas.add(carpeta)
+        carpetas.append(os.path.join(salida,carpeta))
+    return carpetas
+
+def _IniciarTrabajador(graficar):
+    '''
+    Inicializador de cada proceso del lote: los módulos del motor ya vienen importados y, si se
+    grafica, matplotlib se carga una sola vez sin ventanas, así que cada instancia sólo paga su
+    propio cálculo.
+    '''
+    if graficar:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot
+
+def _ResolverInstancia(instancia, carpeta, parámetros):
+    '''
+    Resuelve una instancia dentro de un proceso trabajador. Los errores se reportan en el
+    resumen en lugar de detener el lote.
+    Entradas:
+    instancia: str: archivo de coordenadas
+    carpeta: str: carpeta de salida de esta instancia
+    parámetros: dict: argumentos de Optimización
+    Salidas:
+    fila: dict: una fila del resumen, con las claves de COLUMNAS_RESUMEN
+    '''
+    inicio = time.perf_counter()
+    fila = dict.fromkeys(COLUMNAS_RESUMEN,'')
+    fila.update(instancia=instancia, carpeta=carpeta)
+    try:
+        resultado = Optimización(instancia,directorio=carpeta,**parámetros)
+    except Exception as error:
+        fila['error'] = type(error).__name__+': '+str(error)
+    else:
+        fila.update(ciudades=len(resultado.ruta), longitud=resultado.longitud, generaciones=len(resultado.historial),
+                    carpeta=resultado.carpeta or carpeta)
+    fila['segundos'] = time.perf_counter()-inicio
+    return fila
+
+def ResolverLote(entrada, salida='Lotes', nTrabajos=None, **parámetros):
+    '''
+    Resuelve todas las instancias de un lote en un grupo de procesos que se reutilizan de una
+    instancia a otra, con a lo sumo nTrabajos instancias a la vez. Cada instancia escribe sus
+    archivos (ver resultados) en su propia carpeta dentro de salida, y al final
+    se escribe salida/Resumen.csv con una fila por instancia, en el orden del lote.
+    Entradas:
+    entrada: str: carpeta o manifiesto de instancias (ver ListarInstancias)
+    salida: str: carpeta donde se escriben los resultados
+    nTrabajos: int o None: procesos simultáneos; por defecto uno por núcleo
+    parámetros: argumentos de Optimización para todas las instancias (tamañoPoblación, ...)
+    Salidas:
+    resumen: list: filas del resumen (dict con las claves de COLUMNAS_RESUMEN)
+    '''
+    instancias = ListarInstancias(entrada)
+    carpetas = CarpetasSalida(instancias,salida)
+    os.makedirs(salida,exist_ok=True)
+    nTrabajos = max(1,min(nTrabajos or os.cpu_count() or 1,len(instancias)))
+    with ProcessPoolExecutor(nTrabajos,initializer=_IniciarTrabajador,
+                             initargs=(parámetros.get('graficar',True) and parámetros.get('guardar',True),)) as ejecutor:
+        tareas = [ejecutor.submit(_ResolverInstancia,instancia,carpeta,parámetros)
+                  for instancia, carpeta in zip(instancias,carpetas)]
+        resumen = [tarea.result() for tarea in tareas]
+    EscribirResumen(resumen,os.path.join(salida,'Resumen.csv'))
+    return resumen
+
+def EscribirResumen(resumen, nombreArchivo):
+    '''
+    Escribe las filas del resumen en un csv.
+    Entradas:
+    resumen: list: filas retornadas por ResolverLote
+    nombreArchivo: str: nombre del archivo csv
+    '''
+    with open(nombreArchivo,'w',newline='') as archivo:
+        escritor = csv.DictWriter(archivo,COLUMNAS_RESUMEN)
+        escritor.writeheader()
+        escritor.writerows(resumen)
+
+def TablaResumen(resumen):
+    '''
+    Entradas:
+    resumen: list: filas retornadas por ResolverLote
+    Salidas:
+    tabla: str: resumen en columnas alineadas, para imprimir
+    '''
+    líneas = ['%-30s %8s %14s %12s %10s' % ('instancia','ciudades','longitud','generaciones','segundos')]
+    for fila in resumen:
+        nombre = os.path.basename(fila['instancia'])
+        if fila['error']:
+            líneas.append('%-30s %s' % (nombre,'ERROR '+fila['error']))
+        else:
+            líneas.append('%-30s %8d %14.4f %12d %10.2f' % (nombre,fila['ciudades'],fila['longitud'],
+                                                             fila['generaciones'],fila['segundos']))
+    return '\n'.join(líneas)
@@ -0,0 +1,188 @@
+import os
+import numpy as np
+from .busquedalocal import OperadorBúsquedaLocal
+from .convergencia import ControlConvergencia
+from .cruce import CRUCES, OperadorCruce
+from .evaluacion import MatrizDistancias, LongitudesPoblación
+from .graficas import GraficarRuta, GraficadorAsíncrono, GraficarLongitudes
+from .inicializacion import InicializarPoblación, InicializarPoblaciónModificada
+from .islas import OptimizaciónIslas
+from .lectura import LeerArchivo
+from .perfilado import Perfilador
+from .poblacion import Población
+from .resultados import Resultado, IdentificadorCorrida, CarpetaCorrida, DescartarMetadatos, GuardarResultado
+from .puntocontrol import GuardarPuntoControl, CargarPuntoControl, EstadoGenerador, RestaurarGenerador
+from .seleccion import SELECCIONES
+from .telemetria import Telemetría
+from .vecinos import KVecinosCercanos
+
+def Optimización(ciudades='CoordenadasCiudades.txt', tamañoPoblación=20, nGeneraciones=10000, inicialización='aleatoria',
+                 semilla=23432, nIslas=1, generacionesMigración=100, búsquedaLocal='ninguna',
+                 generacionesBúsquedaLocal=50, cruce=None, selección='torneo', control=None, graficar=True,
+                 guardar=True, nombre='AGE', directorio=None, puntoControl=None, generacionesPuntoControl=500,
+                 reanudar=False, perfilador=None):
+    '''
+    Algoritmo principal del AG, compartido por AGE.py (inicialización aleatoria) y AGM.py
+    (inicialización con la ciudad más cercana). Con guardar=True todo se escribe en la carpeta
+    '<nombre>-<identificador>' (ver resultados), que depende sólo de la configuración, las
+    ciudades y la semilla: la telemetría, la mejor ruta en binario, metadatos.json y, si
+    graficar=True, las gráficas de cada mejora y 'LvsGen.png'. Con guardar=False no crea ningún
+    archivo, lo que sirve para hacer muchas corridas seguidas desde un mismo proceso.
+    Entradas:
+    ciudades: str o nx2 numpy array: archivo de coordenadas (ver LeerArchivo) o las coordenadas
+    tamañoPoblación: int: cantidad de cromosomas (por isla)
+    nGeneraciones: int: cantidad de generaciones
+    inicialización: str: 'aleatoria' o 'vecino' (ciudad más cercana)
+    semilla: int: semilla del generador de números aleatorios
+    nIslas: int: con más de una isla cada población evoluciona en un núcleo distinto
+    generacionesMigración: int: generaciones entre migraciones de las mejores rutas de cada isla
+    búsquedaLocal: str: 'ninguna', 'mejor' o 'todos': cromosomas que se mejoran con 2-opt y Or-opt
+    generacionesBúsquedaLocal: int: generaciones entre búsquedas locales
+    cruce: str o None: 'ox', 'pmx' o 'erx'; en cada generación todos menos el mejor se
+    reemplazan por hijos antes de mutar; con None sólo hay elitismo y mutación
+    selección: str: 'torneo' o 'ruleta': cómo se escogen los padres del cruce
+    control: ControlConvergencia o None: criterios para terminar antes de nGeneraciones o para
+    reaccionar al estancamiento; con None siempre se simulan las nGeneraciones. Se reinicia al
+    comenzar, así que el mismo control sirve para varias corridas
+    graficar: bool: si se grafican las rutas y las longitudes
+    guardar: bool: si se escriben archivos
+    nombre: str: sufijo de los archivos de salida
+    directorio: str o None: carpeta donde se crea la carpeta de la corrida; None es la actual
+    puntoControl: str o None: archivo .npz donde se guarda periódicamente el estado completo
+    de la búsqueda (población, longitudes, telemetría, controlador y generador aleatorio)
+    generacionesPuntoControl: int: generaciones entre puntos de control
+    reanudar: bool: si puntoControl existe se continúa desde ahí, con el mismo resultado que
+    una corrida sin interrupciones; si no existe se empieza desde cero
+    perfilador: Perfilador o None: acumula el tiempo y las llamadas de cada etapa del ciclo y
+    muestrea la memoria; las gráficas intermedias se hacen en otro proceso y no se miden
+    Salidas:
+    resultado: Resultado: mejor ruta, su longitud, historial y carpeta de salida
+    '''
+    if inicialización not in ('aleatoria','vecino'):
+        raise ValueError('inicialización debe ser aleatoria o vecino: '+str(inicialización))
+    if búsquedaLocal not in ('ninguna','mejor','todos'):
+        raise ValueError('búsquedaLocal debe ser ninguna, mejor o todos: '+str(búsquedaLocal))
+    if puntoControl is not None and nIslas>1:
+        raise ValueError('los puntos de control solo se usan con una isla')
+    if cruce is not None and cruce not in CRUCES:
+        raise ValueError('cruce debe ser ox, pmx o erx: '+str(cruce))
+    if selección not in SELECCIONES:
+        raise ValueError('selección debe ser torneo o ruleta: '+str(selección))
+    graficar = graficar and guardar
+    if control is None:
+        control = ControlConvergencia()
+    control.Reiniciar() #si se reanuda, el estado guardado se restaura más abajo
+    if perfilador is None:
+        perfilador = Perfilador(activo=False)
+    etapa = perfilador.Etapa
+    with etapa('lectura'):
+        ubicaciónCiudades = LeerArchivo(ciudades) if isinstance(ciudades,str) else np.asarray(ciudades,dtype=np.float64)
+    nGenes = len(ubicaciónCiudades)
+    with etapa('distancias'):
+        distancias = MatrizDistancias(ubicaciónCiudades) #se calcula una sola vez
+    vecinos = None
+    if búsquedaLocal!='ninguna':
+        with etapa('vecinos'):
+            vecinos = KVecinosCercanos(ubicaciónCiudades,10) #candidatos de 2-opt y Or-opt
+    # Inicialización de variables
+    configuración = {'tamañoPoblación':tamañoPoblación, 'nGeneraciones':nGeneraciones, 'inicialización':inicialización,
+                     'nIslas':nIslas, 'generacionesMigración':generacionesMigración, 'búsquedaLocal':búsquedaLocal,
+                     'generacionesBúsquedaLocal':generacionesBúsquedaLocal, 'cruce':cruce, 'selección':selección,
+                     'control':control.Configuración()}
+    reanudar = reanudar and puntoControl is not None and os.path.exists(puntoControl)
+    if reanudar: #se recupera el estado guardado y se sigue en la misma carpeta
+        arreglos, datos = CargarPuntoControl(puntoControl)
+        if arreglos['cromosomas'].shape!=(tamañoPoblación,nGenes):
+            raise ValueError(puntoControl+': la población guardada no corresponde a estos parámetros')
+        subfolder = datos['carpeta']
+        if subfolder is not None:
+            DescartarMetadatos(subfolder)
+    else:
+        subfolder = CarpetaCorrida(nombre,IdentificadorCorrida(configuración,ubicaciónCiudades,semilla),
+                                   directorio) if guardar else None
+    telemetría = Telemetría(subfolder+'/Telemetría.csv' if subfolder is not None else None,
+                            reanudar=reanudar) #historial por generación, escrito cada 1000
+    if nIslas>1: #modelo de islas en paralelo; sólo se mide el total
+        with etapa('islas'):
+            mejorRuta, telemetría = OptimizaciónIslas(ubicaciónCiudades, nIslas, tamañoPoblación,
+                nGeneraciones, inicialización, generacionesMigración, semilla=semilla, distancias=distancias,
+                telemetría=telemetría, control=control, cruce=cruce, selección=selección, búsquedaLocal=búsquedaLocal,
+                generacionesBúsquedaLocal=generacionesBúsquedaLocal, vecinos=vecinos)
+    else:
+        if reanudar:
+            rng = RestaurarGenerador(datos['generador'])
+            población = Población(arreglos['cromosomas'],distancias)
+            población.longitudes = arreglos['longitudes'] #las guardadas, por las sumas acumuladas de las mutaciones
+            telemetría.Restaurar(datos['telemetría'],arreglos.get('historial'))
+            control.Restaurar(datos['control'])
+            mejorPuntuación = datos['mejorPuntuación']
+            generaciónInicial = datos['generación']
+        else:
+            rng = np.random.default_rng(semilla)
+            with etapa('inicialización'):
+                if inicialización=='vecino':
+                    población = InicializarPoblaciónModificada(tamañoPoblación, nGenes, ubicaciónCiudades, distancias, rng)
+                else:
+                    población = Población(InicializarPoblación(tamañoPoblación, nGenes, rng),distancias)
+            mejorPuntuación = 0
+            generaciónInicial = 0
+        graficador = GraficadorAsíncrono(ubicaciónCiudades,subfolder) if graficar else None #las rutas se grafican en otro proceso
+        for generación in range(generaciónInicial,nGeneraciones): #cada ciclo es una generación completa
+            perfilador.Generación(generación)
+            if puntoControl is not None and generación>generaciónInicial and generación%generacionesPuntoControl==0:
+                with etapa('punto de control'):
+                    datosTelemetría, historial = telemetría.Estado()
+                    arreglos = {'cromosomas':población.cromosomas, 'longitudes':población.longitudes}
+                    if historial is not None:
+                        arreglos['historial'] = historial
+                    GuardarPuntoControl(puntoControl,arreglos,{'generación':generación, 'generador':EstadoGenerador(rng),
+                        'mejorPuntuación':float(mejorPuntuación), 'control':control.Estado(),
+                        'telemetría':datosTelemetría, 'carpeta':subfolder})
+            if búsquedaLocal!='ninguna' and generación%generacionesBúsquedaLocal==0: #paso memético
+                with etapa('búsqueda local'):
+                    filas = [población.Mejor()] if búsquedaLocal=='mejor' else range(tamañoPoblación)
+                    OperadorBúsquedaLocal(población,filas,ubicaciónCiudades,vecinos)
+            with etapa('elitismo'):
+                puntuaciones = población.puntuaciones #las longitudes se actualizan en cada mutación
+                icromosomaMax = población.Mejor() #se selecciona el que no va a cambiar
+            with etapa('telemetría'):
+                telemetría.Registrar(generación,población.longitudes,población.cromosomas,icromosomaMax) #se guardan las longitudes actuales
+            if puntuaciones[icromosomaMax]>mejorPuntuación: #se grafica la nueva mejor ruta
+                mejorPuntuación = puntuaciones[icromosomaMax]
+                if graficador is not None:
+                    with etapa('envío de gráfica'):
+                        graficador.Enviar(población.cromosomas[icromosomaMax],generación)
+            with etapa('convergencia'):
+                estado = control.Revisar(generación,población.longitudes[icromosomaMax])
+            if estado=='detener':
+                break
+            if estado=='estancado' and control.acción=='reiniciar': #todos menos el mejor empiezan de nuevo
+                with etapa('reinicio'):
+                    filas = np.arange(tamañoPoblación)!=icromosomaMax
+                    población.cromosomas[filas] = InicializarPoblación(tamañoPoblación-1, nGenes, rng)
+                    población.Reevaluar()
+            else:
+                if cruce is not None: #todos menos el mejor se reemplazan por hijos
+                    with etapa('cruce'):
+                        OperadorCruce(población,icromosomaMax,rng,cruce,selección)
+                with etapa('mutación'):
+                    población.MutarLote(icromosomaMax,rng,control.intercambios) #se modifica a todos menos el mejor
+        mejorRuta = población.cromosomas[icromosomaMax].copy()
+        if graficador is not None:
+            with etapa('espera de gráficas'):
+                graficador.Cerrar() #se espera a que terminen las gráficas pendientes
+    with etapa('telemetría'):
+        historial = telemetría.Historial() #se termina de escribir el archivo y se lee completo
+    longitud = float(LongitudesPoblación(mejorRuta[None,:],distancias)[0]) #la de la ruta retornada, sin sumas acumuladas
+    if guardar:
+        with etapa('salida'): #se guarda la ruta más corta
+            GuardarResultado(subfolder,mejorRuta,longitud,{'nombre':nombre, 'semilla':semilla,
+                'instancia':ciudades if isinstance(ciudades,str) else None, 'configuración':configuración,
+                'generaciones':len(historial)})
+    if graficar:
+        with etapa('gráficas finales'):
+            GraficarRuta(mejorRuta,ubicaciónCiudades,int(historial[-1,0])+1,subfolder) #se grafica la última mejor ruta
+            GraficarLongitudes(historial,os.path.join(subfolder,'LvsGen.png'))
+    if perfilador.archivoTraza is not None:
+        perfilador.EscribirTraza()
+    return Resultado(mejorRuta,longitud,historial,subfolder)
@@ -0,0 +1,197 @@
+'''
+Núcleos de cálculo del ciclo generacional: longitud de la población, intercambio de genes con
+actualización de longitudes, búsqueda del mejor cromosoma y recorrido del cruce de aristas
+(ERX). Si numba está instalado se compilan con @njit (y la compilación se guarda en disco,
+junto al módulo, para no repetirla en cada arranque); si no, se usan las versiones de NumPy (o
+de Python, donde el cálculo es secuencial). Ambas suman en el mismo orden, así que con la
+misma semilla dan exactamente el mismo resultado.
+La variable de entorno AGVIAJERO_BACKEND puede valer 'auto' (por defecto), 'numba' o 'numpy'.
+'''
+import os
+import numpy as np
+
+BACKENDS = ('auto','numba','numpy')
+
+def LongitudesNumPy(población,distancias):
+    '''
+    Longitud de la ruta cerrada de cada cromosoma, sumando sus aristas en orden.
+    Entradas:
+    población: mxn numpy array: cromosomas, uno por fila
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    Salidas:
+    longitudes: 1xm numpy array: longitud de la ruta de cada cromosoma
+    '''
+    if población.shape[1]==0:
+        return np.zeros(len(población))
+    aristas = distancias[población,np.roll(población,-1,axis=1)]
+    return np.cumsum(aristas,axis=1)[:,-1] #cumsum suma en orden, igual que un ciclo
+
+def IntercambiarNumPy(cromosomas,longitudes,distancias,filas,gen1,gen2):
+    '''
+    Intercambia en el lugar los genes gen1[k] y gen2[k] del cromosoma filas[k] y suma a su
+    longitud el cambio de las (hasta cuatro) aristas afectadas.
+    Entradas:
+    cromosomas: mxn numpy array: cromosomas; se modifican en el lugar
+    longitudes: 1xm numpy array: longitudes; se modifican en el lugar
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    filas: 1xk numpy array: índices de los cromosomas a modificar, sin repetir
+    gen1, gen2: 1xk numpy array: posiciones distintas a intercambiar en cada cromosoma
+    '''
+    n = cromosomas.shape[1]
+    C = cromosomas
+    D = distancias
+    F = filas[:,None]
+    aristas = np.stack(((gen1-1)%n, gen1, (gen2-1)%n, gen2),axis=1) #la arista k une k con k+1
+    siguientes = (aristas+1)%n
+    # si los genes son vecinos (o si n es pequeño) una misma arista aparece dos veces
+    únicas = np.ones(aristas.shape,dtype=bool)
+    for columna in range(1,4):
+        for previa in range(columna):
+            únicas[:,columna] &= aristas[:,columna]!=aristas[:,previa]
+    antes = D[C[F,aristas],C[F,siguientes]]
+    ciudad1 = C[filas,gen1]
+    C[filas,gen1] = C[filas,gen2]
+    C[filas,gen2] = ciudad1
+    cambio = np.where(únicas,D[C[F,aristas],C[F,siguientes]]-antes,0)
+    longitudes[filas] += cambio[:,0]+cambio[:,1]+cambio[:,2]+cambio[:,3]
+
+def ÍndiceMejorNumPy(puntuaciones):
+    '''
+    Índice de la mayor puntuación; con empates, el primero.
+    '''
+    return int(np.argmax(puntuaciones))
+
+def RecorridoAristasNumPy(tablas,primeras,azar,hijos):
+    '''
+    Construye cada hijo del cruce ERX recorriendo su tabla de aristas: desde la primera ciudad
+    se sigue por la vecina sin visitar que tenga menos vecinos sin visitar (con empates, la
+    primera de la tabla); si no queda ninguna se salta a la siguiente ciudad sin visitar de azar.
+    El recorrido es secuencial, así que esta versión es un ciclo de Python sobre listas.
+    Entradas:
+    tablas: kxnx4 numpy array: vecinos de cada ciudad en alguno de los padres; -1 en los repetidos
+    primeras: 1xk numpy array: ciudad inicial de cada hijo
+    azar: kxn numpy array: una permutación por hijo, orden de los saltos
+    hijos: kxn numpy array: se llena en el lugar
+    '''
+    k, n = hijos.shape
+    for i in range(k): #cada ciclo es un hijo
+        vecinos = [[v for v in fila if v>=0] for fila in tablas[i].tolist()]
+        grado = [len(v) for v in vecinos]
+        visitada = [False]*n
+        saltos = azar[i].tolist()
+        siguienteAzar = 0
+        ciudad = int(primeras[i])
+        hijo = [0]*n
+        for posición in range(n):
+            hijo[posición] = ciudad
+            visitada[ciudad] = True
+            mejor = -1
+            for vecino in vecinos[ciudad]:
+                grado[vecino] -= 1
+                if not visitada[vecino] and (mejor<0 or grado[vecino]<grado[mejor]):
+                    mejor = vecino
+            if mejor<0 and posición<n-1:
+                while visitada[saltos[siguienteAzar]]:
+                    siguienteAzar += 1
+                mejor = saltos[siguienteAzar]
+            ciudad = mejor
+        hijos[i] = hijo
+
+def LongitudesNumba(población,distancias):
+    m, n = población.shape
+    longitudes = np.zeros(m)
+    for i in range(m):
+        total = 0.0
+        for j in range(n):
+            siguiente = j+1 if j+1<n else 0
+            total += distancias[población[i,j],población[i,siguiente]]
+        longitudes[i] = total
+    return longitudes
+
+def IntercambiarNumba(cromosomas,longitudes,distancias,filas,gen1,gen2):
+    n = cromosomas.shape[1]
+    aristas = np.empty(4,dtype=np.int64)
+    antes = np.empty(4)
+    for k in range(len(filas)):
+        f = filas[k]
+        aristas[0] = (gen1[k]-1)%n
+        aristas[1] = gen1[k]
+        aristas[2] = (gen2[k]-1)%n
+        aristas[3] = gen2[k]
+        for a in range(4):
+            antes[a] = distancias[cromosomas[f,aristas[a]],cromosomas[f,(aristas[a]+1)%n]]
+        ciudad1 = cromosomas[f,gen1[k]]
+        cromosomas[f,gen1[k]] = cromosomas[f,gen2[k]]
+        cromosomas[f,gen2[k]] = ciudad1
+        total = 0.0
+        for a in range(4):
+            cambio = 0.0
+            única = True
+            for previa in range(a):
+                if aristas[a]==aristas[previa]:
+                    única = False
+            if única:
+                cambio = distancias[cromosomas[f,aristas[a]],cromosomas[f,(aristas[a]+1)%n]]-antes[a]
+            total = cambio if a==0 else total+cambio
+        longitudes[f] += total
+
+def ÍndiceMejorNumba(puntuaciones):
+    imax = 0
+    for i in range(1,len(puntuaciones)):
+        if puntuaciones[i]>puntuaciones[imax]:
+            imax = i
+    return imax
+
+def RecorridoAristasNumba(tablas,primeras,azar,hijos):
+    k, n = hijos.shape
+    grado = np.empty(n,dtype=np.int64)
+    visitada = np.empty(n,dtype=np.bool_)
+    for i in range(k):
+        for ciudad in range(n):
+            grado[ciudad] = 0
+            for columna in range(4):
+                if tablas[i,ciudad,columna]>=0:
+                    grado[ciudad] += 1
+            visitada[ciudad] = False
+        siguienteAzar = 0
+        ciudad = primeras[i]
+        for posición in range(n):
+            hijos[i,posición] = ciudad
+            visitada[ciudad] = True
+            mejor = -1
+            for columna in range(4):
+                vecino = tablas[i,ciudad,columna]
+                if vecino<0:
+                    continue
+                grado[vecino] -= 1
+                if not visitada[vecino] and (mejor<0 or grado[vecino]<grado[mejor]):
+                    mejor = vecino
+            if mejor<0 and posición<n-1:
+                while visitada[azar[i,siguienteAzar]]:
+                    siguienteAzar += 1
+                mejor = azar[i,siguienteAzar]
+            ciudad = mejor
+
+def _Compilar(backend):
+    '''
+    Entradas:
+    backend: str: 'auto', 'numba' o 'numpy'
+    Salidas:
+    nombre: str: backend en uso, 'numba' o 'numpy'
+    núcleos: tuple: (Longitudes, Intercambiar, ÍndiceMejor, RecorridoAristas)
+    '''
+    if backend not in BACKENDS:
+        raise ValueError('AGVIAJERO_BACKEND debe ser auto, numba o numpy: '+str(backend))
+    if backend!='numpy':
+        try:
+            from numba import njit
+        except ImportError:
+            if backend=='numba':
+                raise
+        else:
+            compilar = njit(cache=True,nogil=True)
+            return 'numba', (compilar(LongitudesNumba), compilar(IntercambiarNumba), compilar(ÍndiceMejorNumba),
+                             compilar(RecorridoAristasNumba))
+    return 'numpy', (LongitudesNumPy, IntercambiarNumPy, ÍndiceMejorNumPy, RecorridoAristasNumPy)
+
+BACKEND, (Longitudes, Intercambiar, ÍndiceMejor, RecorridoAristas) = _Compilar(os.environ.get('AGVIAJERO_BACKEND','auto').lower())
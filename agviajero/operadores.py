@@ -0,0 +1,43 @@
+import numpy as np
+from . import nucleos
+
+def GenesAleatorios(nGenes):
+    '''
+    Escoge aleatoriamente dos posiciones distintas dentro de un cromosoma.
+    Entradas:
+    nGenes: int: cantidad de genes del cromosoma
+    Salidas:
+    gen1, gen2: int: posiciones distintas escogidas
+    '''
+    gen1 = np.random.randint(0,nGenes)
+    busqueda = True
+    while busqueda:
+        gen2 = np.random.randint(0,nGenes)
+        busqueda = gen1==gen2
+    return gen1, gen2
+
+def OperadorMutación(individuo):
+    '''
+    Modifica un cromosoma invirtiendo la posición de dos genes aleatoriamente.
+    Entradas:
+    individuo: 1xn matrix: cromosoma a mutar
+    Salidas:
+    cromosomaMutado: 1xn matrix: cromosoma con genes invertidos
+    '''
+    gen1, gen2 = GenesAleatorios(len(individuo))
+    cromosomaMutado = np.copy(individuo)
+    cromosomaMutado[gen1] = individuo[gen2]
+    cromosomaMutado[gen2] = individuo[gen1]
+    return cromosomaMutado
+
+def OperadorElitismo(población,puntuaciones):
+    '''
+    Calcula el índice dentro de la población del cromosoma con mayor puntuación. Si hay empate
+    se conserva el primero.
+    Entradas:
+    población: nxm matrix: matriz que contiene los cromosomas
+    puntuaciones: 1xn numpy array: lista de puntuaciones de cada cromosoma
+    Salidas:
+    imax: int: índice dentro de la población del mejor cromosoma
+    '''
+    return int(nucleos.ÍndiceMejor(np.asarray(puntuaciones,dtype=np.float64)))
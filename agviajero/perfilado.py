@@ -0,0 +1,148 @@
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError: #Windows
+    resource = None
+
+class _EtapaInactiva:
+    '''
+    Contexto que no hace nada, compartido por todas las etapas de un Perfilador inactivo.
+    '''
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*excepción):
+        return False
+
+_INACTIVA = _EtapaInactiva()
+
+class _Etapa:
+    '''
+    Contexto que mide una ejecución de una etapa y la suma al Perfilador.
+    '''
+    __slots__ = ('perfilador','nombre','inicio')
+
+    def __init__(self,perfilador,nombre):
+        self.perfilador = perfilador
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self,*excepción):
+        self.perfilador.Sumar(self.nombre,self.inicio,time.perf_counter_ns()-self.inicio)
+        return False
+
+def MemoriaActual():
+    '''
+    Salidas:
+    tamaño: int o None: memoria residente del proceso; donde no se puede leer la actual (fuera de
+    Linux) se usa el máximo que reporta getrusage
+    '''
+    try:
+        with open('/proc/self/statm','rb') as statm:
+            return int(statm.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+    except (OSError,ValueError,AttributeError):
+        pass
+    if resource is None:
+        return None
+    máximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return máximo if sys.platform=='darwin' else máximo*1024 #macOS reporta bytes, Linux kilobytes
+
+class Perfilador:
+    '''
+    Acumula el tiempo de pared (perf_counter_ns) y la cantidad de llamadas de cada etapa del
+    ciclo de Optimización, y muestrea la memoria cada tantas generaciones. Con activo=False
+    todas las etapas usan el mismo contexto vacío, así que instrumentar el ciclo casi no cuesta.
+    Si se da archivoTraza se guarda además cada llamada para escribir una línea de tiempo en el
+    formato de Chrome (chrome://tracing o Perfetto).
+    Uso:
+    perfilador = Perfilador()
+    with perfilador.Etapa('mutación'):
+        población.MutarLote(imejor,rng)
+    print(perfilador.Resumen())
+    '''
+    def __init__(self,activo=True,archivoTraza=None,muestreoMemoria=100):
+        '''
+        Entradas:
+        activo: bool: si es False no se mide nada
+        archivoTraza: str o None: json donde EscribirTraza guarda la línea de tiempo
+        muestreoMemoria: int: generaciones entre mediciones de memoria
+        '''
+        self.activo = activo
+        self.archivoTraza = archivoTraza
+        self.muestreoMemoria = muestreoMemoria
+        self.tiempos = {}
+        self.llamadas = {}
+        self.eventos = []
+        self.memoria = []
+        self.inicio = time.perf_counter_ns()
+
+    def Etapa(self,nombre):
+        '''
+        Entradas:
+        nombre: str: nombre de la etapa
+        Salidas:
+        contexto: contexto que mide el bloque que encierra
+        '''
+        return _Etapa(self,nombre) if self.activo else _INACTIVA
+
+    def Sumar(self,nombre,inicio,duración):
+        '''
+        Suma una llamada ya medida.
+        Entradas:
+        nombre: str: nombre de la etapa
+        inicio: int: perf_counter_ns al empezar
+        duración: int: nanosegundos
+        '''
+        self.tiempos[nombre] = self.tiempos.get(nombre,0)+duración
+        self.llamadas[nombre] = self.llamadas.get(nombre,0)+1
+        if self.archivoTraza is not None:
+            self.eventos.append((nombre,inicio,duración))
+
+    def Generación(self,generación):
+        '''
+        Se llama una vez por generación; mide la memoria cada muestreoMemoria generaciones.
+        '''
+        if self.activo and generación%self.muestreoMemoria==0:
+            self.memoria.append((generación,time.perf_counter_ns(),MemoriaActual()))
+
+    def Resumen(self):
+        '''
+        Salidas:
+        resumen: str: tabla con el tiempo total, llamadas, tiempo por llamada y fracción del
+        total de cada etapa, de la más costosa a la menos, y la memoria máxima muestreada
+        '''
+        total = max(time.perf_counter_ns()-self.inicio,1)
+        líneas = ['%-20s %10s %12s %16s %7s' % ('etapa','llamadas','total[ms]','por llamada[µs]','%')]
+        for nombre in sorted(self.tiempos,key=self.tiempos.get,reverse=True):
+            tiempo, llamadas = self.tiempos[nombre], self.llamadas[nombre]
+            líneas.append('%-20s %10d %12.2f %16.2f %7.1f' % (nombre,llamadas,tiempo/1e6,tiempo/llamadas/1e3,
+                                                              100*tiempo/total))
+        líneas.append('%-20s %10s %12.2f' % ('total','',total/1e6))
+        memorias = [tamaño for generación, instante, tamaño in self.memoria if tamaño is not None]
+        if memorias:
+            líneas.append('memoria máxima muestreada: %.1f MB' % (max(memorias)/2**20))
+        return '\n'.join(líneas)
+
+    def EscribirTraza(self,archivoTraza=None):
+        '''
+        Escribe las llamadas medidas como eventos completos ('X') y la memoria como contador ('C')
+        del formato Trace Event de Chrome, con tiempos en microsegundos desde el inicio.
+        Entradas:
+        archivoTraza: str o None: archivo json; por defecto el indicado al crear el Perfilador
+        '''
+        archivoTraza = archivoTraza or self.archivoTraza
+        proceso = os.getpid()
+        eventos = [{'name':nombre, 'ph':'X', 'ts':(inicio-self.inicio)/1e3, 'dur':duración/1e3, 'pid':proceso, 'tid':0}
+                   for nombre, inicio, duración in self.eventos]
+        eventos += [{'name':'memoria', 'ph':'C', 'ts':(instante-self.inicio)/1e3, 'pid':proceso,
+                     'args':{'MB':tamaño/2**20}}
+                    for generación, instante, tamaño in self.memoria if tamaño is not None]
+        with open(archivoTraza,'w') as archivo:
+            json.dump({'traceEvents':eventos, 'displayTimeUnit':'ms'},archivo,ensure_ascii=False)
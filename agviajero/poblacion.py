@@ -0,0 +1,118 @@
+import numpy as np
+from . import nucleos
+from .evaluacion import LongitudesPoblación
+from .operadores import OperadorElitismo
+
+class Población:
+    '''
+    Población de cromosomas guardada en una sola matriz contigua de enteros, junto con la
+    longitud de la ruta de cada cromosoma. Las mutaciones modifican la matriz en el lugar y
+    actualizan las longitudes con las aristas que tocan, sin crear arreglos por cromosoma.
+    Atributos:
+    cromosomas: mxn numpy array: matriz int16 (o int32 si hay más de 32768 ciudades) con los cromosomas
+    longitudes: 1xm numpy array: longitud de la ruta de cada cromosoma
+    distancias: nxn numpy array: matriz de distancias entre ciudades
+    '''
+    def __init__(self,cromosomas,distancias):
+        '''
+        Entradas:
+        cromosomas: mxn matrix: cromosomas iniciales, uno por fila
+        distancias: nxn numpy array: matriz de distancias entre ciudades
+        '''
+        nGenes = len(distancias)
+        tipo = np.int16 if nGenes<=np.iinfo(np.int16).max+1 else np.int32
+        self.cromosomas = np.ascontiguousarray(cromosomas,dtype=tipo)
+        self.distancias = distancias
+        self.Reevaluar()
+
+    def __len__(self):
+        return len(self.cromosomas)
+
+    @property
+    def nGenes(self):
+        return self.cromosomas.shape[1]
+
+    @property
+    def puntuaciones(self):
+        '''
+        Puntuación de cada cromosoma: el inverso de la longitud de su ruta.
+        '''
+        return 1/self.longitudes
+
+    def Reevaluar(self):
+        '''
+        Vuelve a calcular desde cero la longitud de todos los cromosomas.
+        '''
+        self.longitudes = LongitudesPoblación(self.cromosomas,self.distancias)
+
+    def Mejor(self):
+        '''
+        Salidas:
+        imax: int: índice del cromosoma con mayor puntuación
+        '''
+        return OperadorElitismo(self.cromosomas,self.puntuaciones)
+
+    def Reemplazar(self,i,cromosoma):
+        '''
+        Reemplaza el cromosoma i y calcula su longitud.
+        Entradas:
+        i: int: índice del cromosoma a reemplazar
+        cromosoma: 1xn matrix: nuevo cromosoma
+        '''
+        self.cromosomas[i] = cromosoma
+        self.longitudes[i] = LongitudesPoblación(self.cromosomas[i:i+1],self.distancias)[0]
+
+    def ReemplazarFilas(self,filas,cromosomas):
+        '''
+        Reemplaza varios cromosomas a la vez y calcula sólo sus longitudes.
+        Entradas:
+        filas: 1xk numpy array: índices de los cromosomas a reemplazar
+        cromosomas: kxn matrix: nuevos cromosomas
+        '''
+        self.cromosomas[filas] = cromosomas
+        self.longitudes[filas] = LongitudesPoblación(self.cromosomas[filas],self.distancias)
+
+    def Intercambiar(self,filas,gen1,gen2):
+        '''
+        Intercambia en el lugar los genes gen1[k] y gen2[k] del cromosoma filas[k], para todas
+        las k a la vez, y actualiza sus longitudes con las aristas afectadas.
+        Entradas:
+        filas: 1xk numpy array: índices de los cromosomas a modificar, sin repetir
+        gen1, gen2: 1xk numpy array: posiciones distintas a intercambiar en cada cromosoma
+        '''
+        nucleos.Intercambiar(self.cromosomas,self.longitudes,self.distancias,filas,gen1,gen2)
+
+    def Mutar(self,i,rng):
+        '''
+        Intercambia dos genes escogidos aleatoriamente en el cromosoma i.
+        Entradas:
+        i: int: índice del cromosoma a mutar
+        rng: numpy Generator: generador de números aleatorios
+        '''
+        self.MutarFilas(np.array([i]),rng)
+
+    def MutarLote(self,excluir,rng,nIntercambios=1):
+        '''
+        Intercambia dos genes aleatorios en todos los cromosomas menos en el indicado, con un
+        solo llamado vectorizado por intercambio.
+        Entradas:
+        excluir: int: índice del cromosoma que no se modifica (el mejor)
+        rng: numpy Generator: generador de números aleatorios
+        nIntercambios: int: intercambios seguidos que recibe cada cromosoma
+        '''
+        filas = np.arange(len(self))
+        filas = filas[filas!=excluir]
+        for intercambio in range(nIntercambios):
+            self.MutarFilas(filas,rng)
+
+    def MutarFilas(self,filas,rng):
+        '''
+        Intercambia dos genes aleatorios distintos en cada uno de los cromosomas indicados.
+        Entradas:
+        filas: 1xk numpy array: índices de los cromosomas a mutar, sin repetir
+        rng: numpy Generator: generador de números aleatorios
+        '''
+        n = self.nGenes
+        gen1 = rng.integers(0,n,len(filas))
+        gen2 = (gen1+rng.integers(1,n,len(filas)))%n #nunca coincide con gen1
+        self.Intercambiar(filas,gen1,gen2)
@@ -0,0 +1,51 @@
+import json
+import os
+import numpy as np
+
+def GuardarPuntoControl(archivo,arreglos,datos):
+    '''
+    Guarda el estado de una corrida en un .npz sin comprimir. Primero se escribe un archivo
+    temporal y luego se reemplaza el anterior con os.replace, así una interrupción a la mitad
+    nunca deja un punto de control incompleto.
+    Entradas:
+    archivo: str: nombre del punto de control
+    arreglos: dict: numpy arrays (población, longitudes, historial, ...)
+    datos: dict: valores que se pueden escribir como JSON (generación, estado del generador, ...)
+    '''
+    carpeta = os.path.dirname(os.path.abspath(archivo))
+    os.makedirs(carpeta,exist_ok=True)
+    temporal = archivo+'.tmp'
+    with open(temporal,'wb') as salida: #con un objeto archivo np.savez no agrega la extensión
+        np.savez(salida,_datos=np.array(json.dumps(datos)),**arreglos)
+        salida.flush()
+        os.fsync(salida.fileno())
+    os.replace(temporal,archivo)
+
+def CargarPuntoControl(archivo):
+    '''
+    Lee un punto de control escrito por GuardarPuntoControl.
+    Entradas:
+    archivo: str: nombre del punto de control
+    Salidas:
+    arreglos: dict: numpy arrays guardados
+    datos: dict: valores guardados como JSON
+    '''
+    with np.load(archivo,allow_pickle=False) as npz:
+        arreglos = {clave:npz[clave] for clave in npz.files if clave!='_datos'}
+        datos = json.loads(str(npz['_datos']))
+    return arreglos, datos
+
+def EstadoGenerador(rng):
+    '''
+    Estado del generador de bits de rng como dict JSON (los enteros de 128 bits de PCG64 los
+    escribe json sin perder precisión).
+    '''
+    return rng.bit_generator.state
+
+def RestaurarGenerador(estado):
+    '''
+    Crea un numpy Generator que continúa exactamente donde quedó el guardado con EstadoGenerador.
+    '''
+    bitGenerator = getattr(np.random,estado['bit_generator'])()
+    bitGenerator.state = estado
+    return np.random.Generator(bitGenerator)
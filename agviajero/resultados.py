@@ -0,0 +1,197 @@
+'''
+Almacén de resultados. Cada corrida se guarda en una carpeta '<nombre>-<identificador>' cuyo
+identificador es un hash de la configuración, las coordenadas y la semilla, así que la misma
+corrida siempre cae en la misma carpeta y ésta se crea en un solo paso. Dentro quedan la ruta
+en binario (ruta.npy y ruta.varint, diferencias consecutivas en zigzag y varint) y
+metadatos.json, que se escribe al final y marca la corrida como completa.
+'''
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+import numpy as np
+from .telemetria import LeerTelemetría
+
+ARCHIVO_METADATOS = 'metadatos.json'
+ARCHIVO_RUTA = 'ruta.npy'
+ARCHIVO_VARINT = 'ruta.varint'
+
+Resultado = namedtuple('Resultado',['ruta','longitud','historial','carpeta'])
+Resultado.__doc__ = '''
+Resultado de Optimización.
+ruta: 1xn numpy array: mejor ruta encontrada
+longitud: float: longitud de esa ruta
+historial: gx5 numpy array: filas de Telemetría (generación, mejor, promedio, peor, diversidad)
+carpeta: str o None: carpeta con las gráficas y la telemetría, si se guardaron archivos
+'''
+
+def IdentificadorCorrida(configuración, ciudadesXY, semilla):
+    '''
+    Entradas:
+    configuración: dict: parámetros de la corrida que se pueden escribir como JSON
+    ciudadesXY: nx2 numpy array: coordenadas de las ciudades
+    semilla: int: semilla de la corrida
+    Salidas:
+    identificador: str: 16 caracteres hexadecimales
+    '''
+    resumen = hashlib.blake2b(digest_size=8)
+    resumen.update(json.dumps(configuración,sort_keys=True,ensure_ascii=False).encode())
+    resumen.update(np.ascontiguousarray(ciudadesXY,dtype=np.float64).tobytes())
+    resumen.update(str(semilla).encode())
+    return resumen.hexdigest()
+
+def CarpetaCorrida(nombre, identificador, directorio=None):
+    '''
+    Crea (si no existe) la carpeta de una corrida. Si ya existe se borra su metadatos.json,
+    para que mientras se repite la corrida no aparezca como completa con los datos anteriores.
+    Entradas:
+    nombre: str: prefijo legible, por ejemplo AGE
+    identificador: str: retornado por IdentificadorCorrida
+    directorio: str o None: carpeta base; None es la carpeta actual
+    Salidas:
+    carpeta: str: ruta de la carpeta
+    '''
+    carpeta = nombre+'-'+identificador
+    if directorio is not None:
+        carpeta = os.path.join(directorio,carpeta)
+    os.makedirs(carpeta,exist_ok=True)
+    DescartarMetadatos(carpeta)
+    return carpeta
+
+def DescartarMetadatos(carpeta):
+    '''
+    Borra metadatos.json de la carpeta, si existe, para marcar la corrida como incompleta.
+    '''
+    try:
+        os.remove(os.path.join(carpeta,ARCHIVO_METADATOS))
+    except FileNotFoundError:
+        pass
+
+def CodificarVarintDelta(ruta):
+    '''
+    Codifica una ruta como la diferencia entre ciudades consecutivas (la primera respecto de 0),
+    en zigzag para que las diferencias negativas pequeñas también ocupen pocos bytes, y en
+    varint LEB128: 7 bits por byte y el bit alto indica que el número sigue. Todo vectorizado.
+    Entradas:
+    ruta: 1xn numpy array: ciudades de la ruta
+    Salidas:
+    datos: bytes: ruta codificada
+    '''
+    diferencias = np.diff(np.asarray(ruta,dtype=np.int64),prepend=0)
+    zigzag = ((diferencias<<1)^(diferencias>>63)).astype(np.uint64)
+    nBytes = np.ones(len(zigzag),dtype=np.int64)
+    while True:
+        faltan = (zigzag>>np.uint64(7*nBytes))>0
+        if not faltan.any():
+            break
+        nBytes += faltan
+    inicios = np.cumsum(nBytes)-nBytes
+    datos = np.empty(int(nBytes.sum()),dtype=np.uint8)
+    for k in range(int(nBytes.max(initial=0))):
+        conByte = nBytes>k
+        grupo = (zigzag[conByte]>>np.uint64(7*k))&np.uint64(0x7f)
+        sigue = np.where(nBytes[conByte]>k+1,0x80,0).astype(np.uint64)
+        datos[inicios[conByte]+k] = grupo|sigue
+    return datos.tobytes()
+
+def DecodificarVarintDelta(datos):
+    '''
+    Inverso de CodificarVarintDelta.
+    Entradas:
+    datos: bytes: ruta codificada
+    Salidas:
+    ruta: 1xn numpy array: ciudades de la ruta
+    '''
+    datos = np.frombuffer(datos,dtype=np.uint8)
+    finales = (datos&0x80)==0
+    número = np.cumsum(finales)-finales #a qué número pertenece cada byte
+    primeros = np.flatnonzero(np.append(True,finales[:-1]))
+    posición = np.arange(len(datos))-primeros[número] #byte dentro del número
+    partes = (datos&0x7f).astype(np.uint64)<<(7*posición).astype(np.uint64)
+    zigzag = np.bitwise_or.reduceat(partes,primeros) if len(datos) else np.zeros(0,dtype=np.uint64)
+    diferencias = (zigzag>>np.uint64(1)).astype(np.int64)^-(zigzag&np.uint64(1)).astype(np.int64)
+    ruta = np.cumsum(diferencias)
+    for tipo in (np.int16,np.int32): #como los cromosomas
+        if ruta.max(initial=0)<=np.iinfo(tipo).max and ruta.min(initial=0)>=np.iinfo(tipo).min:
+            return ruta.astype(tipo)
+    return ruta
+
+def GuardarResultado(carpeta, ruta, longitud, metadatos):
+    '''
+    Escribe la ruta en ruta.npy y ruta.varint y, al final, metadatos.json (por medio de un
+    archivo temporal, para que una corrida interrumpida nunca aparezca como completa).
+    Entradas:
+    carpeta: str: carpeta de la corrida (ver CarpetaCorrida)
+    ruta: 1xn numpy array: mejor ruta
+    longitud: float: su longitud
+    metadatos: dict: datos de la corrida que se pueden escribir como JSON
+    '''
+    ruta = np.asarray(ruta)
+    np.save(os.path.join(carpeta,ARCHIVO_RUTA),ruta)
+    with open(os.path.join(carpeta,ARCHIVO_VARINT),'wb') as archivo:
+        archivo.write(CodificarVarintDelta(ruta))
+    metadatos = dict(metadatos, longitud=float(longitud), nCiudades=len(ruta),
+                     fecha=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    temporal = os.path.join(carpeta,ARCHIVO_METADATOS+'.tmp')
+    with open(temporal,'w') as archivo:
+        json.dump(metadatos,archivo,indent=1,ensure_ascii=False)
+    os.replace(temporal,os.path.join(carpeta,ARCHIVO_METADATOS))
+
+def LeerMetadatos(carpeta):
+    '''
+    Salidas:
+    metadatos: dict: contenido de metadatos.json, más la clave 'carpeta'
+    '''
+    with open(os.path.join(carpeta,ARCHIVO_METADATOS)) as archivo:
+        metadatos = json.load(archivo)
+    metadatos['carpeta'] = carpeta
+    return metadatos
+
+def LeerRuta(archivo):
+    '''
+    Lee una ruta guardada como .npy o .varint.
+    Entradas:
+    archivo: str: ruta.npy o ruta.varint (o la carpeta de la corrida, que usa ruta.npy)
+    Salidas:
+    ruta: 1xn numpy array: ciudades de la ruta
+    '''
+    if os.path.isdir(archivo):
+        archivo = os.path.join(archivo,ARCHIVO_RUTA)
+    if archivo.endswith('.varint'):
+        with open(archivo,'rb') as datos:
+            return DecodificarVarintDelta(datos.read())
+    return np.load(archivo)
+
+def LeerResultado(carpeta, conHistorial=False):
+    '''
+    Entradas:
+    carpeta: str: carpeta de la corrida
+    conHistorial: bool: si también se lee Telemetría.csv (es texto, así que es lo más lento)
+    Salidas:
+    resultado: Resultado: ruta, longitud, historial (None si conHistorial es False) y carpeta
+    metadatos: dict: contenido de metadatos.json
+    '''
+    metadatos = LeerMetadatos(carpeta)
+    historial = None
+    if conHistorial and os.path.exists(os.path.join(carpeta,'Telemetría.csv')):
+        historial = LeerTelemetría(os.path.join(carpeta,'Telemetría.csv'))
+    return Resultado(LeerRuta(carpeta),metadatos['longitud'],historial,carpeta), metadatos
+
+def ListarResultados(directorio='.', nombre=None):
+    '''
+    Metadatos de todas las corridas completas dentro de directorio (sin leer las rutas).
+    Entradas:
+    directorio: str: carpeta donde se buscan las corridas
+    nombre: str o None: si se da, sólo las corridas con ese nombre (AGE, AGM, ...)
+    Salidas:
+    corridas: list: metadatos de cada corrida, ordenados por carpeta
+    '''
+    corridas = []
+    with os.scandir(directorio) as entradas:
+        for entrada in sorted(entradas,key=lambda e: e.name):
+            if not entrada.is_dir() or (nombre is not None and not entrada.name.startswith(nombre+'-')):
+                continue
+            if os.path.exists(os.path.join(entrada.path,ARCHIVO_METADATOS)):
+                corridas.append(LeerMetadatos(entrada.path))
+    return corridas
@@ -0,0 +1,35 @@
+import numpy as np
+
+def SelecciónTorneo(puntuaciones, nPadres, rng, tamañoTorneo=3):
+    '''
+    Escoge nPadres cromosomas con torneos: en cada torneo compiten tamañoTorneo cromosomas
+    sorteados con reemplazo y gana el de mayor puntuación. Todos los torneos se resuelven con
+    una sola matriz de competidores.
+    Entradas:
+    puntuaciones: 1xm numpy array: puntuación de cada cromosoma
+    nPadres: int: cantidad de padres a escoger
+    rng: numpy Generator: generador de números aleatorios
+    tamañoTorneo: int: competidores por torneo; más competidores es más presión de selección
+    Salidas:
+    padres: 1xnPadres numpy array: índices de los cromosomas escogidos
+    '''
+    competidores = rng.integers(0,len(puntuaciones),(nPadres,tamañoTorneo))
+    ganador = np.argmax(puntuaciones[competidores],axis=1)
+    return competidores[np.arange(nPadres),ganador]
+
+def SelecciónRuleta(puntuaciones, nPadres, rng):
+    '''
+    Escoge nPadres cromosomas con probabilidad proporcional a su puntuación: se sortean
+    puntos en la suma acumulada de las puntuaciones y se buscan todos a la vez.
+    Entradas:
+    puntuaciones: 1xm numpy array: puntuación de cada cromosoma (positiva)
+    nPadres: int: cantidad de padres a escoger
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    padres: 1xnPadres numpy array: índices de los cromosomas escogidos
+    '''
+    acumulada = np.cumsum(puntuaciones)
+    puntos = rng.random(nPadres)*acumulada[-1]
+    return np.minimum(np.searchsorted(acumulada,puntos,side='right'),len(puntuaciones)-1)
+
+SELECCIONES = {'torneo':SelecciónTorneo, 'ruleta':SelecciónRuleta}
@@ -0,0 +1,124 @@
+import os
+import numpy as np
+
+COLUMNAS = ('generación','mejor','promedio','peor','diversidad')
+
+class Telemetría:
+    '''
+    Historial de la corrida con una fila por generación: mejor longitud, longitud promedio,
+    peor longitud y diversidad de la población. Las filas se acumulan en un bloque
+    preasignado de cadaN filas; cuando se llena se agrega al final de un archivo csv (que se
+    puede seguir con tail mientras corre la simulación) o, sin archivo, se guarda en memoria
+    y se empieza un bloque nuevo. Así nunca se copia el historial completo por generación.
+    '''
+    def __init__(self,archivo=None,cadaN=1000,muestreoDiversidad=10,reanudar=False):
+        '''
+        Entradas:
+        archivo: str o None: csv donde se escriben las filas; si es None todo queda en memoria
+        cadaN: int: cantidad de generaciones entre escrituras
+        muestreoDiversidad: int: la diversidad se calcula cada tantas generaciones (cuesta
+        recorrer toda la población); en las demás se guarda nan
+        reanudar: bool: si es True no se reescribe el archivo; se usa junto con Restaurar
+        '''
+        self.archivo = archivo
+        self.bloque = np.empty((cadaN,len(COLUMNAS)))
+        self.fila = 0
+        self.bloquesGuardados = []
+        self.filasGuardadas = 0
+        self.muestreoDiversidad = muestreoDiversidad
+        if archivo is not None and not reanudar:
+            with open(archivo,'w') as csv:
+                csv.write(','.join(COLUMNAS)+'\n')
+
+    def __len__(self):
+        return self.filasGuardadas+self.fila
+
+    def Registrar(self,generación,longitudes,cromosomas,imejor):
+        '''
+        Agrega la fila de una generación.
+        Entradas:
+        generación: int: número de la generación
+        longitudes: 1xm numpy array: longitud de la ruta de cada cromosoma
+        cromosomas: mxn numpy array: cromosomas de la población
+        imejor: int: índice del mejor cromosoma
+        '''
+        if generación%self.muestreoDiversidad==0: #fracción media de genes distintos al mejor
+            diversidad = np.count_nonzero(cromosomas!=cromosomas[imejor])/cromosomas.size
+        else:
+            diversidad = np.nan
+        promedio = 1/np.average(1/longitudes) #inverso de la puntuación promedio
+        self.Agregar(generación,longitudes[imejor],promedio,np.max(longitudes),diversidad)
+
+    def Agregar(self,generación,mejor,promedio,peor,diversidad):
+        '''
+        Agrega una fila ya calculada, por ejemplo la combinación de varias islas.
+        '''
+        self.bloque[self.fila] = (generación,mejor,promedio,peor,diversidad)
+        self.fila += 1
+        if self.fila==len(self.bloque):
+            self.Vaciar()
+
+    def Vaciar(self):
+        '''
+        Escribe en el archivo (o guarda en memoria) las filas acumuladas en el bloque.
+        '''
+        if self.fila==0:
+            return
+        filas = self.bloque[:self.fila]
+        if self.archivo is None:
+            self.bloquesGuardados.append(filas.copy())
+        else:
+            with open(self.archivo,'a') as csv:
+                np.savetxt(csv,filas,fmt=['%d','%.17g','%.17g','%.17g','%.6g'],delimiter=',')
+        self.filasGuardadas += self.fila
+        self.fila = 0
+
+    def Estado(self):
+        '''
+        Vacía el bloque y describe lo registrado hasta ahora, para un punto de control.
+        Salidas:
+        datos: dict: filas guardadas y, con archivo, su tamaño en bytes
+        historial: gx5 numpy array o None: las filas, solo si no hay archivo
+        '''
+        self.Vaciar()
+        if self.archivo is None:
+            return {'filas':self.filasGuardadas}, self.Historial()
+        return {'filas':self.filasGuardadas, 'bytes':os.path.getsize(self.archivo)}, None
+
+    def Restaurar(self,datos,historial=None):
+        '''
+        Vuelve al estado descrito por Estado. Con archivo se recorta el csv al tamaño que tenía,
+        descartando las filas escritas después del punto de control.
+        Entradas:
+        datos: dict: lo retornado por Estado
+        historial: gx5 numpy array o None: las filas, si no hay archivo
+        '''
+        self.fila = 0
+        self.filasGuardadas = datos['filas']
+        if self.archivo is None:
+            self.bloquesGuardados = [np.array(historial,dtype=np.float64).reshape(-1,len(COLUMNAS))]
+        else:
+            with open(self.archivo,'r+b') as csv:
+                csv.truncate(datos['bytes'])
+
+    def Historial(self):
+        '''
+        Salidas:
+        historial: gx5 numpy array: todas las filas registradas, en el orden de COLUMNAS
+        '''
+        self.Vaciar()
+        if self.archivo is None:
+            if not self.bloquesGuardados:
+                return np.empty((0,len(COLUMNAS)))
+            return np.concatenate(self.bloquesGuardados)
+        return LeerTelemetría(self.archivo)
+
+def LeerTelemetría(archivo):
+    '''
+    Lee el csv escrito por Telemetría.
+    Entradas:
+    archivo: str: nombre del archivo csv
+    Salidas:
+    historial: gx5 numpy array: filas del archivo, en el orden de COLUMNAS
+    '''
+    return np.loadtxt(archivo,delimiter=',',skiprows=1,ndmin=2).reshape(-1,len(COLUMNAS))
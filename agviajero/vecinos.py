@@ -0,0 +1,150 @@
+import math
+import numpy as np
+
+class RejillaCiudades:
+    '''
+    Rejilla uniforme sobre las coordenadas de las ciudades para encontrar la ciudad no visitada
+    más cercana a una ciudad dada sin recorrer todas las ciudades. Cada celda guarda las
+    ciudades que caen en ella; al visitar una ciudad se quita de su celda y se marca en una
+    máscara booleana. Con unas dos ciudades por celda cada consulta revisa sólo unas pocas
+    celdas alrededor, por lo que construir una ruta completa cuesta cerca de O(n log n).
+    '''
+    def __init__(self,ciudadesXY,ciudadesPorCelda=2):
+        '''
+        Entradas:
+        ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+        ciudadesPorCelda: int: cantidad promedio de ciudades deseada en cada celda
+        '''
+        X, Y = np.asarray(ciudadesXY,dtype=np.float64).T
+        self.nCiudades = len(X)
+        self.XY = (X, Y)
+        self.X = X.tolist() #listas para acceder rápido a valores sueltos
+        self.Y = Y.tolist()
+        self.xMin, self.yMin = X.min(), Y.min()
+        lado = max(X.max()-self.xMin, Y.max()-self.yMin, 1e-12)
+        self.nCeldas = max(1,int(math.ceil(math.sqrt(self.nCiudades/ciudadesPorCelda))))
+        self.tamañoCelda = lado/self.nCeldas
+        self.celdaX = np.minimum(((X-self.xMin)/self.tamañoCelda).astype(np.int64),self.nCeldas-1)
+        self.celdaY = np.minimum(((Y-self.yMin)/self.tamañoCelda).astype(np.int64),self.nCeldas-1)
+        self.Reiniciar()
+
+    def Reiniciar(self):
+        '''
+        Vuelve a dejar todas las ciudades como no visitadas.
+        '''
+        self.celdas = [[[] for j in range(self.nCeldas)] for i in range(self.nCeldas)]
+        for ciudad, (i, j) in enumerate(zip(self.celdaX.tolist(),self.celdaY.tolist())):
+            self.celdas[i][j].append(ciudad) #cada celda queda ordenada por índice
+        self.visitado = np.zeros(self.nCiudades,dtype=bool)
+        self.restantes = self.nCiudades
+
+    def Visitar(self,ciudad):
+        '''
+        Marca una ciudad como visitada y la quita de su celda.
+        Entradas:
+        ciudad: int: índice de la ciudad
+        '''
+        if not self.visitado[ciudad]:
+            self.visitado[ciudad] = True
+            self.celdas[self.celdaX[ciudad]][self.celdaY[ciudad]].remove(ciudad)
+            self.restantes -= 1
+
+    def MásCercanoNoVisitado(self,ciudad):
+        '''
+        Busca la ciudad no visitada más cercana a la ciudad dada revisando anillos de celdas
+        cada vez más grandes, hasta que ninguna celda más lejana pueda tener una más cercana.
+        Si hay empate se escoge la de menor índice.
+        Entradas:
+        ciudad: int: índice de la ciudad de referencia
+        Salidas:
+        iSiguiente: int: índice de la ciudad más cercana, o -1 si ya no quedan ciudades
+        '''
+        if self.restantes==0:
+            return -1
+        x, y = self.X[ciudad], self.Y[ciudad]
+        ci, cj = int(self.celdaX[ciudad]), int(self.celdaY[ciudad])
+        distmin = math.inf
+        iSiguiente = -1
+        radio = 0
+        while radio<self.nCeldas:
+            if (2*radio+1)**2>4*self.restantes: #quedan pocas ciudades: conviene revisarlas todas
+                return self._MásCercanoDirecto(x,y)
+            for i in range(max(ci-radio,0),min(ci+radio,self.nCeldas-1)+1):
+                borde = i==ci-radio or i==ci+radio
+                for j in range(max(cj-radio,0),min(cj+radio,self.nCeldas-1)+1):
+                    if not borde and j!=cj-radio and j!=cj+radio:
+                        continue #sólo se revisa el anillo nuevo
+                    for candidato in self.celdas[i][j]:
+                        dist = math.hypot(self.X[candidato]-x,self.Y[candidato]-y)
+                        if dist<distmin or (dist==distmin and candidato<iSiguiente):
+                            distmin = dist
+                            iSiguiente = candidato
+            if distmin<radio*self.tamañoCelda: #nada fuera del anillo puede estar más cerca
+                break
+            radio += 1
+        return iSiguiente
+
+    def _MásCercanoDirecto(self,x,y):
+        '''
+        Revisa de una vez todas las ciudades no visitadas; se usa cuando quedan pocas y la
+        rejilla está casi vacía.
+        '''
+        restantes = np.flatnonzero(~self.visitado)
+        X = self.XY[0][restantes]
+        Y = self.XY[1][restantes]
+        return int(restantes[np.argmin(np.hypot(X-x,Y-y))]) #argmin conserva el menor índice
+
+def KVecinosCercanos(ciudadesXY,k):
+    '''
+    Calcula para cada ciudad la lista de sus k ciudades más cercanas, ordenadas de la más
+    cercana a la más lejana, sin formar la matriz de distancias completa. Las ciudades se
+    ordenan por celda de una rejilla y, para cada celda, se comparan sus ciudades sólo con las
+    de las celdas vecinas, ampliando el bloque hasta que ninguna ciudad fuera de él pueda estar
+    entre las k más cercanas.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas [x,y] de cada ciudad, una por fila
+    k: int: cantidad de vecinos por ciudad (se reduce a n-1 si hay menos ciudades)
+    Salidas:
+    vecinos: nxk numpy array: vecinos[a] son las k ciudades más cercanas a la ciudad a
+    '''
+    XY = np.asarray(ciudadesXY,dtype=np.float64)
+    nCiudades = len(XY)
+    k = min(k,nCiudades-1)
+    tipo = np.int16 if nCiudades<=np.iinfo(np.int16).max+1 else np.int32
+    vecinos = np.empty((nCiudades,max(k,0)),dtype=tipo)
+    if k<=0:
+        return vecinos
+    mínimo = XY.min(0)
+    lado = max(float((XY.max(0)-mínimo).max()),1e-12)
+    nCeldas = max(1,int(math.ceil(math.sqrt(nCiudades/max(k,2)))))
+    tamañoCelda = lado/nCeldas
+    celdas = np.minimum(((XY-mínimo)/tamañoCelda).astype(np.int64),nCeldas-1)
+    clave = celdas[:,0]*nCeldas+celdas[:,1]
+    orden = np.argsort(clave,kind='stable')
+    inicios = np.searchsorted(clave[orden],np.arange(nCeldas*nCeldas+1))
+    def Ciudades(i,j): #ciudades de la celda (i,j)
+        c = i*nCeldas+j
+        return orden[inicios[c]:inicios[c+1]]
+    for i in range(nCeldas):
+        for j in range(nCeldas):
+            propias = Ciudades(i,j)
+            if len(propias)==0:
+                continue
+            radio = 1
+            while True:
+                bloque = [propias]+[Ciudades(a,b) for a in range(max(i-radio,0),min(i+radio,nCeldas-1)+1)
+                                   for b in range(max(j-radio,0),min(j+radio,nCeldas-1)+1) if (a,b)!=(i,j)]
+                candidatas = np.concatenate(bloque)
+                completo = radio>=nCeldas
+                if len(candidatas)>k or completo:
+                    dist = np.hypot(XY[propias,0][:,None]-XY[candidatas,0][None,:],
+                                    XY[propias,1][:,None]-XY[candidatas,1][None,:])
+                    dist[np.arange(len(propias)),np.arange(len(propias))] = np.inf #cada ciudad no es su propio vecino
+                    cercanas = np.argpartition(dist,k-1,axis=1)[:,:k]
+                    dk = np.take_along_axis(dist,cercanas,axis=1)
+                    if completo or dk.max()<=radio*tamañoCelda: #fuera del bloque todo está más lejos
+                        ordenadas = np.argsort(dk,axis=1,kind='stable')
+                        vecinos[propias] = candidatas[np.take_along_axis(cercanas,ordenadas,axis=1)]
+                        break
+                radio += 1
+    return vecinos
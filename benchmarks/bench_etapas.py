@@ -0,0 +1,227 @@
+'''
+Mide el costo de cada etapa del AG (matriz de distancias, evaluación, inicialización aleatoria
+y con la ciudad más cercana, mutación, gráfica de la ruta y una generación completa) sobre
+ciudades sintéticas uniformes y agrupadas de 50 a 100000 puntos, y la calidad alcanzada contra
+el tiempo de cada configuración del motor. Los resultados se escriben en un JSON; si se da
+uno anterior con --compare se reportan las etapas que se hicieron más lentas.
+Uso:
+python benchmarks/bench_etapas.py --output resultados.json
+python benchmarks/bench_etapas.py --output nuevos.json --compare resultados.json
+'''
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from agviajero import (MatrizDistancias, EvaluarPoblación, InicializarPoblación, InicializarPoblaciónModificada,
+                       OperadorMutación, Población, GraficarRuta, Optimización, ControlConvergencia)
+
+CIUDADES = [50, 500, 2000, 10000, 100000]
+POBLACIONES = [20, 40]
+LÍMITE_DENSO = 5000 #la matriz de distancias de más ciudades no cabe cómodamente en memoria
+LÍMITE_GRÁFICA = 10000
+GENERACIONES_CICLO = 200
+
+def CiudadesUniformes(nCiudades, rng):
+    '''
+    Entradas:
+    nCiudades: int: cantidad de ciudades
+    rng: numpy Generator: generador de números aleatorios
+    Salidas:
+    ciudadesXY: nx2 numpy array: coordenadas uniformes en [0,100)x[0,100)
+    '''
+    return rng.uniform(0,100,(nCiudades,2))
+
+def CiudadesAgrupadas(nCiudades, rng, nGrupos=None):
+    '''
+    Ciudades repartidas en grupos gaussianos con centros uniformes, como las instancias
+    "clustered" de la literatura.
+    Entradas:
+    nCiudades: int: cantidad de ciudades
+    rng: numpy Generator: generador de números aleatorios
+    nGrupos: int o None: cantidad de grupos; por defecto una raíz de n/10
+    Salidas:
+    ciudadesXY: nx2 numpy array: coordenadas de las ciudades
+    '''
+    nGrupos = nGrupos or max(1,int(np.sqrt(nCiudades/10)))
+    centros = rng.uniform(0,100,(nGrupos,2))
+    grupo = rng.integers(0,nGrupos,nCiudades)
+    return centros[grupo]+rng.normal(0,100/(4*np.sqrt(nGrupos)),(nCiudades,2))
+
+DISTRIBUCIONES = {'uniforme':CiudadesUniformes, 'agrupada':CiudadesAgrupadas}
+
+def Medir(función, repeticiones=3):
+    '''
+    Entradas:
+    función: función sin argumentos a medir
+    repeticiones: int: cantidad de mediciones; se reporta la menor
+    Salidas:
+    tiempo: float: segundos de la mejor repetición
+    '''
+    tiempos = []
+    for repetición in range(repeticiones):
+        inicio = time.perf_counter()
+        función()
+        tiempos.append(time.perf_counter()-inicio)
+    return min(tiempos)
+
+class ControlReloj(ControlConvergencia):
+    '''
+    Control que nunca detiene la corrida y anota, en cada generación, el instante
+    (perf_counter) en que el motor lo revisa. Así el tiempo de cada generación es el real,
+    incluidas las búsquedas locales que sólo se hacen cada tantas generaciones.
+    '''
+    def Reiniciar(self):
+        super().Reiniciar()
+        self.instantes = []
+
+    def Revisar(self,generación,mejorLongitud):
+        self.instantes.append(time.perf_counter())
+        return super().Revisar(generación,mejorLongitud)
+
+def MedirGeneración(ciudadesXY, tamañoPoblación, repeticiones=5):
+    '''
+    Tiempo de una generación del ciclo de Optimización, sin la preparación: entre la primera y
+    la última revisión del control de cada corrida, dividido por las generaciones de en medio.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas de las ciudades
+    tamañoPoblación: int: cantidad de cromosomas
+    repeticiones: int: cantidad de corridas; se reporta la mediana
+    Salidas:
+    tiempo: float: segundos por generación
+    '''
+    tiempos = []
+    for repetición in range(repeticiones):
+        control = ControlReloj()
+        Optimización(ciudadesXY,tamañoPoblación,GENERACIONES_CICLO,control=control,graficar=False,guardar=False)
+        tiempos.append((control.instantes[-1]-control.instantes[0])/(len(control.instantes)-1))
+    return float(np.median(tiempos))
+
+def MedirEtapas(ciudadesXY, tamañoPoblación, carpeta):
+    '''
+    Mide cada etapa con una instancia y un tamaño de población. Las etapas que necesitan la
+    matriz de distancias sólo se miden hasta LÍMITE_DENSO ciudades.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas de las ciudades
+    tamañoPoblación: int: cantidad de cromosomas
+    carpeta: str: carpeta temporal para las gráficas
+    Salidas:
+    tiempos: dict: segundos por etapa
+    '''
+    nGenes = len(ciudadesXY)
+    rng = np.random.default_rng(23432)
+    tiempos = {'inicialización aleatoria':Medir(lambda: InicializarPoblación(tamañoPoblación,nGenes,rng))}
+    cromosomas = InicializarPoblación(tamañoPoblación,nGenes,rng)
+    if nGenes<=LÍMITE_GRÁFICA:
+        import matplotlib
+        matplotlib.use('Agg')
+        tiempos['gráfica'] = Medir(lambda: GraficarRuta(cromosomas[0],ciudadesXY,0,carpeta),1)
+    if nGenes>LÍMITE_DENSO:
+        return tiempos
+    tiempos['matriz de distancias'] = Medir(lambda: MatrizDistancias(ciudadesXY),1)
+    distancias = MatrizDistancias(ciudadesXY)
+    tiempos['evaluación'] = Medir(lambda: EvaluarPoblación(cromosomas,distancias))
+    tiempos['inicialización vecino'] = Medir(lambda: InicializarPoblaciónModificada(tamañoPoblación,nGenes,ciudadesXY,
+                                                                                    distancias,rng),1)
+    tiempos['mutación operador'] = Medir(lambda: [OperadorMutación(cromosoma) for cromosoma in cromosomas])
+    población = Población(cromosomas,distancias)
+    tiempos['mutación lote'] = Medir(lambda: población.MutarLote(0,rng))
+    tiempos['generación'] = MedirGeneración(ciudadesXY,tamañoPoblación)
+    return tiempos
+
+def CurvaCalidad(ciudadesXY, nGeneraciones, configuraciones):
+    '''
+    Corre cada configuración del motor y anota el instante de cada generación, contado desde
+    el llamado a Optimización (incluye la preparación). Se reporta el tiempo hasta llegar a
+    10%, 5% y 1% sobre la mejor longitud que encontró cualquiera de las configuraciones.
+    Entradas:
+    ciudadesXY: nx2 numpy array: coordenadas de las ciudades
+    nGeneraciones: int: generaciones de cada corrida
+    configuraciones: dict: nombre -> argumentos de Optimización
+    Salidas:
+    curvas: dict: nombre -> tiempo total, mejor longitud final y tiempo hasta cada objetivo
+    '''
+    corridas = {}
+    for nombre, argumentos in configuraciones.items():
+        control = ControlReloj()
+        inicio = time.perf_counter()
+        resultado = Optimización(ciudadesXY,nGeneraciones=nGeneraciones,control=control,graficar=False,guardar=False,
+                                 **argumentos)
+        corridas[nombre] = (np.array(control.instantes)-inicio, time.perf_counter()-inicio, resultado.historial[:,1])
+    referencia = min(float(mejores[-1]) for instantes, tiempo, mejores in corridas.values())
+    curvas = {}
+    for nombre, (instantes, tiempo, mejores) in corridas.items():
+        curvas[nombre] = {'tiempo':tiempo, 'longitud':float(mejores[-1]), 'objetivos':{}}
+        for exceso in (0.10, 0.05, 0.01):
+            alcanzadas = np.flatnonzero(mejores<=referencia*(1+exceso))
+            curvas[nombre]['objetivos']['%d%%' % round(100*exceso)] = (float(instantes[alcanzadas[0]])
+                                                                      if len(alcanzadas) else None)
+    return curvas
+
+def Comparar(actuales, anteriores, tolerancia):
+    '''
+    Entradas:
+    actuales, anteriores: dict: resultados de main con la misma estructura
+    tolerancia: float: razón de tiempos a partir de la cual se considera una regresión
+    Salidas:
+    regresiones: list: (caso, etapa, tiempo anterior, tiempo actual)
+    '''
+    regresiones = []
+    for caso, tiempos in actuales['etapas'].items():
+        for etapa, tiempo in tiempos.items():
+            anterior = anteriores.get('etapas',{}).get(caso,{}).get(etapa)
+            if anterior and tiempo>anterior*tolerancia:
+                regresiones.append((caso,etapa,anterior,tiempo))
+    return regresiones
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Mide las etapas del AG con ciudades sintéticas.')
+    parser.add_argument('--output',default=None,help='JSON donde se guardan los resultados')
+    parser.add_argument('--compare',default=None,help='JSON anterior contra el que se comparan los tiempos')
+    parser.add_argument('--tolerance',type=float,default=1.25,help='razón de tiempos que cuenta como regresión')
+    parser.add_argument('--max-cities',type=int,default=max(CIUDADES),help='se omiten las instancias más grandes')
+    parser.add_argument('--quality-cities',type=int,default=200,help='ciudades de las curvas de calidad')
+    parser.add_argument('--quality-generations',type=int,default=3000,help='generaciones de las curvas de calidad')
+    opciones = parser.parse_args(argumentos)
+    resultados = {'entorno':{'python':platform.python_version(), 'numpy':np.__version__,
+                             'máquina':platform.machine(), 'sistema':platform.system()},
+                  'etapas':{}, 'calidad':{}}
+    print('%10s %8s %8s %24s %12s' % ('ciudades','tipo','población','etapa','tiempo[s]'))
+    with tempfile.TemporaryDirectory() as carpeta:
+        for nCiudades in [n for n in CIUDADES if n<=opciones.max_cities]:
+            for distribución, Generar in DISTRIBUCIONES.items():
+                ciudadesXY = Generar(nCiudades,np.random.default_rng(nCiudades))
+                for tamañoPoblación in POBLACIONES:
+                    caso = '%s-%d-%d' % (distribución,nCiudades,tamañoPoblación)
+                    resultados['etapas'][caso] = MedirEtapas(ciudadesXY,tamañoPoblación,carpeta)
+                    for etapa, tiempo in resultados['etapas'][caso].items():
+                        print('%10d %8s %8d %24s %12.6f' % (nCiudades,distribución,tamañoPoblación,etapa,tiempo))
+    configuraciones = {'AGE':{'tamañoPoblación':20,'inicialización':'aleatoria'},
+                       'AGM':{'tamañoPoblación':40,'inicialización':'vecino'},
+                       'AGM 2-opt':{'tamañoPoblación':40,'inicialización':'vecino','búsquedaLocal':'mejor'}}
+    print('\n%8s %12s %10s %10s %10s %10s %10s' % ('tipo','configuración','tiempo[s]','longitud','+10%[s]','+5%[s]','+1%[s]'))
+    for distribución, Generar in DISTRIBUCIONES.items():
+        ciudadesXY = Generar(opciones.quality_cities,np.random.default_rng(opciones.quality_cities))
+        curvas = CurvaCalidad(ciudadesXY,opciones.quality_generations,configuraciones)
+        resultados['calidad'][distribución] = curvas
+        for nombre, curva in curvas.items():
+            objetivos = ['%10s' % ('-' if t is None else '%.4f' % t) for t in curva['objetivos'].values()]
+            print('%8s %12s %10.3f %10.2f %s' % (distribución,nombre,curva['tiempo'],curva['longitud'],' '.join(objetivos)))
+    if opciones.output is not None:
+        with open(opciones.output,'w') as archivo:
+            json.dump(resultados,archivo,indent=1,ensure_ascii=False)
+    if opciones.compare is not None:
+        with open(opciones.compare) as archivo:
+            regresiones = Comparar(resultados,json.load(archivo),opciones.tolerance)
+        for caso, etapa, anterior, actual in regresiones:
+            print('REGRESIÓN %s %s: %.6f s -> %.6f s' % (caso,etapa,anterior,actual))
+        if regresiones:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
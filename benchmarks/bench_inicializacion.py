@@ -0,0 +1,60 @@
+'''
+Mide cómo crece el tiempo de arranque de InicializarPoblación con la cantidad de ciudades y el
+tamaño de la población. Como referencia se mide también el método anterior (genes aleatorios
+descartando repetidos) en los casos pequeños, donde todavía termina en un tiempo razonable.
+Uso: python benchmarks/bench_inicializacion.py
+'''
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from agviajero import InicializarPoblación
+
+def InicializarPoblaciónRechazo(tamañoPoblación, nGenes, rng):
+    '''
+    Método de inicialización anterior, conservado sólo para comparar: se sortean genes y se
+    descartan los que ya están en el cromosoma.
+    '''
+    población = []
+    for i in range(tamañoPoblación):
+        cromosoma = []
+        while len(cromosoma)<nGenes:
+            nuevoGen = rng.integers(0,nGenes)
+            if nuevoGen not in cromosoma:
+                cromosoma.append(nuevoGen)
+        población.append(cromosoma)
+    return np.array(población)
+
+def Medir(función, tamañoPoblación, nGenes, repeticiones=3):
+    '''
+    Entradas:
+    función: función de inicialización a medir
+    tamañoPoblación: int: cantidad de cromosomas
+    nGenes: int: cantidad de ciudades
+    repeticiones: int: cantidad de mediciones; se reporta la menor
+    Salidas:
+    tiempo: float: segundos de la mejor repetición
+    '''
+    tiempos = []
+    for repetición in range(repeticiones):
+        rng = np.random.default_rng(23432)
+        inicio = time.perf_counter()
+        función(tamañoPoblación, nGenes, rng)
+        tiempos.append(time.perf_counter()-inicio)
+    return min(tiempos)
+
+def main():
+    print('%8s %8s %14s %14s' % ('ciudades','población','permutación[s]','rechazo[s]'))
+    for nGenes in [50, 500, 2000, 10000, 100000]:
+        for tamañoPoblación in [20, 40, 200]:
+            tPermutación = Medir(InicializarPoblación, tamañoPoblación, nGenes)
+            if nGenes*tamañoPoblación<=100000:
+                tRechazo = '%14.4f' % Medir(InicializarPoblaciónRechazo, tamañoPoblación, nGenes, 1)
+            else:
+                tRechazo = '%14s' % '-'
+            print('%8d %8d %14.4f %s' % (nGenes, tamañoPoblación, tPermutación, tRechazo))
+
+if __name__ == '__main__':
+    main()
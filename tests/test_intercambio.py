@@ -0,0 +1,71 @@
+'''
+La actualización de longitudes por intercambio de genes (sólo las aristas afectadas) debe dar lo
+mismo que volver a evaluar el cromosoma completo con LongitudesPoblación.
+'''
+import itertools
+import numpy as np
+import pytest
+from agviajero import nucleos
+from agviajero.evaluacion import MatrizDistancias, LongitudesPoblación
+from agviajero.poblacion import Población
+
+NÚCLEOS = {'numpy':nucleos.IntercambiarNumPy, nucleos.BACKEND:nucleos.Intercambiar}
+
+def Instancia(nGenes, tamañoPoblación=4, semilla=0):
+    '''
+    Salidas:
+    cromosomas: mxn numpy array: permutaciones aleatorias
+    distancias: nxn numpy array: matriz de distancias de ciudades aleatorias
+    '''
+    rng = np.random.default_rng(semilla)
+    distancias = MatrizDistancias(rng.uniform(0,100,(nGenes,2)))
+    cromosomas = np.array([rng.permutation(nGenes) for i in range(tamañoPoblación)],dtype=np.int16)
+    return cromosomas, distancias
+
+def Pares(nGenes):
+    '''
+    Todos los pares de posiciones distintas, incluidos los vecinos y el par (0, n-1) que cierra la ruta.
+    '''
+    return [(gen1,gen2) for gen1, gen2 in itertools.permutations(range(nGenes),2)]
+
+@pytest.mark.parametrize('backend',sorted(NÚCLEOS))
+@pytest.mark.parametrize('nGenes',[2,3,4,5,8])
+def test_IntercambiarIgualAReevaluar(backend, nGenes):
+    Intercambiar = NÚCLEOS[backend]
+    for gen1, gen2 in Pares(nGenes):
+        cromosomas, distancias = Instancia(nGenes)
+        longitudes = LongitudesPoblación(cromosomas,distancias)
+        filas = np.array([0,2])
+        Intercambiar(cromosomas,longitudes,distancias,filas,np.array([gen1,gen1]),np.array([gen2,gen2]))
+        np.testing.assert_allclose(longitudes,LongitudesPoblación(cromosomas,distancias),rtol=0,atol=1e-9)
+
+@pytest.mark.parametrize('backend',sorted(NÚCLEOS))
+def test_IntercambiarMuchasVeces(backend):
+    Intercambiar = NÚCLEOS[backend]
+    cromosomas, distancias = Instancia(50,tamañoPoblación=10)
+    longitudes = LongitudesPoblación(cromosomas,distancias)
+    rng = np.random.default_rng(1)
+    filas = np.arange(10)
+    for intercambio in range(500):
+        gen1 = rng.integers(0,50,10)
+        gen2 = (gen1+rng.integers(1,50,10))%50
+        Intercambiar(cromosomas,longitudes,distancias,filas,gen1,gen2)
+    np.testing.assert_allclose(longitudes,LongitudesPoblación(cromosomas,distancias),rtol=1e-12)
+
+@pytest.mark.parametrize('nGenes',[2,3,6])
+def test_PoblaciónIntercambiar(nGenes):
+    for gen1, gen2 in Pares(nGenes):
+        cromosomas, distancias = Instancia(nGenes)
+        población = Población(cromosomas,distancias)
+        población.Intercambiar(np.array([1]),np.array([gen1]),np.array([gen2]))
+        np.testing.assert_allclose(población.longitudes,LongitudesPoblación(población.cromosomas,distancias),
+                                   rtol=0,atol=1e-9)
+        assert sorted(población.cromosomas[1])==list(range(nGenes))
+
+def test_PoblaciónMutarLote():
+    cromosomas, distancias = Instancia(30,tamañoPoblación=8)
+    población = Población(cromosomas,distancias)
+    rng = np.random.default_rng(2)
+    for generación in range(200):
+        población.MutarLote(población.Mejor(),rng,nIntercambios=2)
+    np.testing.assert_allclose(población.longitudes,LongitudesPoblación(población.cromosomas,distancias),rtol=1e-12)
@@ -0,0 +1,29 @@
+'''
+Cuando el control detiene el modelo de islas, la ruta retornada debe ser la de la generación en
+que se detuvo: su longitud tiene que coincidir con la última fila de la telemetría.
+'''
+import numpy as np
+import pytest
+from agviajero import Optimización, ControlConvergencia
+from agviajero.evaluacion import MatrizDistancias, LongitudesPoblación
+
+CIUDADES = np.random.default_rng(5).uniform(0,100,(40,2))
+PARÁMETROS = dict(nIslas=2, tamañoPoblación=10, nGeneraciones=300, generacionesMigración=100, guardar=False)
+
+def Revisar(resultado, generacionesEsperadas):
+    assert len(resultado.historial)==generacionesEsperadas
+    assert resultado.longitud==pytest.approx(resultado.historial[-1,1],rel=1e-12)
+    longitud = LongitudesPoblación(resultado.ruta[None,:],MatrizDistancias(CIUDADES))[0]
+    assert resultado.longitud==pytest.approx(longitud,rel=1e-12)
+
+@pytest.mark.parametrize('búsquedaLocal',['ninguna','mejor'])
+@pytest.mark.parametrize('generaciónParada',[0,130])
+def test_DetenciónIslas(búsquedaLocal, generaciónParada):
+    completa = Optimización(CIUDADES,búsquedaLocal=búsquedaLocal,**PARÁMETROS)
+    mejores = completa.historial[:,1]
+    objetivo = mejores[generaciónParada]
+    primera = int(np.flatnonzero(mejores<=objetivo)[0]) #la corrida se detiene en la primera que llega
+    detenida = Optimización(CIUDADES,búsquedaLocal=búsquedaLocal,control=ControlConvergencia(longitudObjetivo=objetivo),
+                            **PARÁMETROS)
+    Revisar(detenida,primera+1)
+    np.testing.assert_array_equal(detenida.historial,completa.historial[:primera+1])
@@ -0,0 +1,66 @@
+'''
+Las versiones de NumPy y las compiladas con numba de cada núcleo deben dar exactamente el mismo
+resultado con las mismas entradas.
+'''
+import numpy as np
+import pytest
+from agviajero import nucleos
+from agviajero.cruce import TablaAristas
+from agviajero.evaluacion import MatrizDistancias
+
+numba = pytest.importorskip('numba')
+
+def Compilar(nombre):
+    '''
+    Salidas:
+    numpy, compilado: funciones: versión de NumPy del núcleo y versión de numba compilada
+    '''
+    return getattr(nucleos,nombre+'NumPy'), numba.njit(getattr(nucleos,nombre+'Numba'))
+
+def Instancia(nGenes, tamañoPoblación, semilla=0):
+    rng = np.random.default_rng(semilla)
+    distancias = MatrizDistancias(rng.uniform(0,100,(nGenes,2)))
+    cromosomas = np.array([rng.permutation(nGenes) for i in range(tamañoPoblación)],dtype=np.int16)
+    return cromosomas, distancias, rng
+
+@pytest.mark.parametrize('nGenes',[1,2,3,7,200])
+def test_Longitudes(nGenes):
+    NumPy, Numba = Compilar('Longitudes')
+    cromosomas, distancias, rng = Instancia(nGenes,6)
+    np.testing.assert_array_equal(NumPy(cromosomas,distancias),Numba(cromosomas,distancias))
+
+@pytest.mark.parametrize('nGenes',[2,3,7,200])
+def test_Intercambiar(nGenes):
+    NumPy, Numba = Compilar('Intercambiar')
+    cromosomas, distancias, rng = Instancia(nGenes,6)
+    longitudes = nucleos.LongitudesNumPy(cromosomas,distancias)
+    copias = cromosomas.copy(), longitudes.copy()
+    filas = np.array([0,2,5])
+    for intercambio in range(100):
+        gen1 = rng.integers(0,nGenes,3)
+        gen2 = (gen1+rng.integers(1,nGenes,3))%nGenes
+        NumPy(cromosomas,longitudes,distancias,filas,gen1,gen2)
+        Numba(copias[0],copias[1],distancias,filas,gen1,gen2)
+    np.testing.assert_array_equal(cromosomas,copias[0])
+    np.testing.assert_array_equal(longitudes,copias[1])
+
+@pytest.mark.parametrize('puntuaciones',[[1.0],[3.0,1.0,3.0],[0.5,0.25,2.0,2.0],
+                                         np.random.default_rng(3).random(50)])
+def test_ÍndiceMejor(puntuaciones):
+    NumPy, Numba = Compilar('ÍndiceMejor')
+    puntuaciones = np.asarray(puntuaciones,dtype=np.float64)
+    assert NumPy(puntuaciones)==Numba(puntuaciones)
+
+@pytest.mark.parametrize('nGenes',[2,3,4,10,300])
+def test_RecorridoAristas(nGenes):
+    NumPy, Numba = Compilar('RecorridoAristas')
+    padres1, distancias, rng = Instancia(nGenes,8)
+    padres2 = padres1[rng.permutation(8)]
+    tablas = np.stack([TablaAristas(a,b) for a, b in zip(padres1,padres2)])
+    azar = np.stack([rng.permutation(nGenes) for i in range(8)])
+    primeras = padres1[:,0].astype(np.intp)
+    hijos = [np.empty_like(padres1), np.empty_like(padres1)]
+    NumPy(tablas,primeras,azar,hijos[0])
+    Numba(tablas,primeras,azar,hijos[1])
+    np.testing.assert_array_equal(hijos[0],hijos[1])
+    assert (np.sort(hijos[0],axis=1)==np.arange(nGenes)).all()
@@ -0,0 +1,51 @@
+'''
+Una corrida interrumpida y reanudada desde su punto de control debe terminar exactamente igual
+que la misma corrida sin interrupciones: misma ruta, misma longitud y misma telemetría.
+'''
+import os
+import numpy as np
+import pytest
+from agviajero import Optimización, ControlConvergencia
+from agviajero.telemetria import Telemetría
+
+CIUDADES = np.random.default_rng(7).uniform(0,100,(30,2))
+
+class Interrupción(Exception):
+    pass
+
+def Parámetros(cruce):
+    return dict(tamañoPoblación=10, nGeneraciones=2500, cruce=cruce, graficar=False,
+                control=ControlConvergencia(paciencia=150,acción='mutación'))
+
+def Interrumpir(monkeypatch, generación):
+    '''
+    Hace que la corrida falle al registrar la generación indicada, como si se cortara ahí.
+    '''
+    Registrar = Telemetría.Registrar
+    def RegistrarHasta(self, g, *argumentos):
+        if g==generación:
+            raise Interrupción
+        return Registrar(self,g,*argumentos)
+    monkeypatch.setattr(Telemetría,'Registrar',RegistrarHasta)
+
+@pytest.mark.parametrize('guardar',[False,True])
+@pytest.mark.parametrize('cruce',[None,'ox'])
+def test_ReanudarIgualQueSinInterrupción(tmp_path, monkeypatch, guardar, cruce):
+    directa = Optimización(CIUDADES,guardar=guardar,directorio=str(tmp_path/'directa'),**Parámetros(cruce))
+    puntoControl = str(tmp_path/'punto.npz')
+    reanudada = str(tmp_path/'reanudada')
+    with monkeypatch.context() as parche:
+        Interrumpir(parche,1730) #después del punto de control de la generación 1500 y de una escritura del csv
+        with pytest.raises(Interrupción):
+            Optimización(CIUDADES,guardar=guardar,directorio=reanudada,puntoControl=puntoControl,
+                         generacionesPuntoControl=500,**Parámetros(cruce))
+    assert os.path.exists(puntoControl)
+    resultado = Optimización(CIUDADES,guardar=guardar,directorio=reanudada,puntoControl=puntoControl,
+                             generacionesPuntoControl=500,reanudar=True,**Parámetros(cruce))
+    np.testing.assert_array_equal(resultado.ruta,directa.ruta)
+    assert resultado.longitud==directa.longitud
+    np.testing.assert_array_equal(resultado.historial,directa.historial)
+    if guardar:
+        with open(os.path.join(resultado.carpeta,'Telemetría.csv')) as a, \
+             open(os.path.join(directa.carpeta,'Telemetría.csv')) as b:
+            assert a.read()==b.read()
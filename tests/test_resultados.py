@@ -0,0 +1,40 @@
+'''
+La codificación de rutas en diferencias zigzag y varint debe recuperar exactamente la ruta, con
+el tipo entero más pequeño que la contiene.
+'''
+import numpy as np
+import pytest
+from agviajero.resultados import CodificarVarintDelta, DecodificarVarintDelta, GuardarResultado, LeerRuta, CarpetaCorrida
+
+RUTAS = {
+    'vacía':[],
+    'una':[0],
+    'ascendente':list(range(100)),
+    'descendente':list(range(100))[::-1],
+    'permutación':np.random.default_rng(0).permutation(1000),
+    'int32':np.random.default_rng(1).permutation(70000),
+    'grandes':[0,2**40,5,2**62,3,2**31,2**31-1],
+    'negativos':[3,-2**35,7,-1,0],
+}
+
+@pytest.mark.parametrize('nombre',sorted(RUTAS))
+def test_IdaYVuelta(nombre):
+    ruta = np.asarray(RUTAS[nombre],dtype=np.int64)
+    decodificada = DecodificarVarintDelta(CodificarVarintDelta(ruta))
+    np.testing.assert_array_equal(decodificada,ruta)
+    for tipo in (np.int16,np.int32,np.int64):
+        if len(ruta)==0 or (ruta.min()>=np.iinfo(tipo).min and ruta.max()<=np.iinfo(tipo).max):
+            assert decodificada.dtype==tipo
+            break
+
+def test_DiferenciasPequeñasOcupanUnByte():
+    ruta = np.arange(500)
+    assert len(CodificarVarintDelta(ruta))==len(ruta)
+    assert len(CodificarVarintDelta(ruta[::-1]))==len(ruta)+1 #sólo la primera, 499, necesita dos
+
+def test_LeerRutaGuardada(tmp_path):
+    ruta = np.random.default_rng(2).permutation(40000).astype(np.int32)
+    carpeta = CarpetaCorrida('AGE','prueba',str(tmp_path))
+    GuardarResultado(carpeta,ruta,1.0,{})
+    np.testing.assert_array_equal(LeerRuta(carpeta),ruta)
+    np.testing.assert_array_equal(LeerRuta(carpeta+'/ruta.varint'),ruta)